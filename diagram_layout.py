@@ -0,0 +1,482 @@
+"""
+Diagram layout -- automatic layered placement for box-and-arrow slides
+Nodes, edges and groups in; node and group rectangles (EMU) out.
+
+Usage:
+    from diagram_layout import layout, parse_ascii
+    python diagram_layout.py --bench 800                  (timing, cold vs cached)
+    python diagram_layout.py --ascii architecture-slide-deck/09-execution-engine.md
+
+Nodes are ids, or (id, label[, detail]) tuples; only the ids matter here.
+Edges are (source, target) pairs and may name a group, which stands for all
+of the nodes inside it. Groups are (id, label, members) with members being
+node ids or other group ids, so groups nest.
+
+The layout is the usual layered one: back edges of cycles are reversed,
+nodes get the longest-path layer from the sources, a few barycenter sweeps
+order each layer (members of a group are kept side by side), and layers are
+spread evenly across the box. Every step is linear in nodes + edges apart
+from the per-layer sorts, so hundreds of nodes take milliseconds. Results
+are cached by a hash of the graph and the box size -- in memory, and on
+disk as well when DIAGRAM_CACHE names a directory.
+"""
+
+import hashlib
+import json
+import os
+import random
+import re
+import sys
+import time
+
+EMU = 914400                     # per inch
+NODE_SIZE = (int(3.0 * EMU), int(0.9 * EMU))
+NODE_GAP = int(0.25 * EMU)       # between neighbours in the widest layer
+GROUP_PAD = int(0.1 * EMU)       # around a group's members
+GROUP_LABEL = int(0.28 * EMU)    # above them, for the group's label
+SWEEPS = 4
+CACHE_SIZE = 512
+CACHE_DIR = os.environ.get("DIAGRAM_CACHE")
+
+_cache = {}
+
+
+def node_id(node):
+    return node if isinstance(node, str) else node[0]
+
+
+def graph_key(ids, edges, groups, width, height, direction, node_size):
+    """Hash of everything the layout depends on (labels don't)."""
+    blob = json.dumps([list(ids), [list(e) for e in edges],
+                       [[gid, list(members)] for gid, _, members in groups],
+                       int(width), int(height), direction, list(node_size)])
+    return hashlib.sha1(blob.encode("utf-8")).hexdigest()
+
+
+def layout(nodes, edges, width, height, groups=(), direction="TB", node_size=NODE_SIZE):
+    """Place `nodes` in a width x height box (EMU, origin top left).
+
+    Returns {"nodes": {id: [x, y, w, h]}, "groups": {id: [x, y, w, h]}, "layers": n,
+    "direction": d}. `direction` is "TB" (layers top to bottom), "LR" (left to
+    right) or "auto" (whichever gives the bigger boxes).
+    """
+    ids = [node_id(n) for n in nodes]
+    edges = [tuple(e) for e in edges]
+    groups = [(g[0], g[1], tuple(g[2])) for g in groups]
+    key = graph_key(ids, edges, groups, width, height, direction, node_size)
+    result = _cache.get(key)
+    if result is not None:
+        return result
+
+    path = os.path.join(CACHE_DIR, key + ".json") if CACHE_DIR else None
+    if path and os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            result = json.load(f)
+    else:
+        result = _layout(ids, edges, groups, int(width), int(height), direction, node_size)
+        if path:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            with open(path + ".tmp", "w", encoding="utf-8") as f:
+                json.dump(result, f)
+            os.replace(path + ".tmp", path)
+    if len(_cache) >= CACHE_SIZE:
+        _cache.pop(next(iter(_cache)))
+    _cache[key] = result
+    return result
+
+
+# ══════════════════════════════════════════════════════════════
+# LAYERED LAYOUT
+# ══════════════════════════════════════════════════════════════
+def _layout(ids, edges, groups, width, height, direction, node_size):
+    index = {n: i for i, n in enumerate(ids)}
+    n = len(ids)
+    children = {gid: members for gid, _, members in groups}
+    parent = {}
+    for gid, members in children.items():
+        for m in members:
+            parent[m] = gid
+
+    leaves = {}
+
+    def leaves_of(item):
+        if item in index:
+            return (index[item],)
+        if item not in leaves:
+            leaves[item] = ()                        # guards against cyclic nesting
+            leaves[item] = tuple(v for m in children.get(item, ()) for v in leaves_of(m))
+        return leaves[item]
+
+    # ── Expand group endpoints, drop self loops, reverse back edges ──
+    succ = [[] for _ in range(n)]
+    seen = set()
+    for a, b in edges:
+        for u in leaves_of(a):
+            for v in leaves_of(b):
+                if u != v and (u, v) not in seen:
+                    seen.add((u, v))
+                    succ[u].append(v)
+    succ = _break_cycles(succ)
+    pred = [[] for _ in range(n)]
+    for u, vs in enumerate(succ):
+        for v in vs:
+            pred[v].append(u)
+
+    # ── Longest-path layering (Kahn order); loose nodes go last ──
+    layer = [0] * n
+    indegree = [len(p) for p in pred]
+    queue = [v for v in range(n) if not indegree[v]]
+    for u in queue:                                  # queue grows while we walk it
+        for v in succ[u]:
+            layer[v] = max(layer[v], layer[u] + 1)
+            indegree[v] -= 1
+            if not indegree[v]:
+                queue.append(v)
+    if seen:
+        last = max(layer) + 1
+        for v in range(n):
+            if not succ[v] and not pred[v]:
+                layer[v] = last
+    count = max(layer) + 1 if n else 0
+    layers = [[] for _ in range(count)]
+    for v in range(n):                               # input order is the first guess
+        layers[layer[v]].append(v)
+    layers = [l for l in layers if l]
+
+    # ── Barycenter sweeps; group members stay together ──
+    chain = []
+    for v in range(n):
+        ancestors, g = [], parent.get(ids[v])
+        while g is not None and g not in ancestors:
+            ancestors.append(g)
+            g = parent.get(g)
+        chain.append(ancestors[::-1])                # outermost first
+    pos = [0.0] * n
+    for l in layers:
+        for i, v in enumerate(l):
+            pos[v] = (i + 0.5) / len(l)
+    for sweep in range(SWEEPS):
+        down = sweep % 2 == 0
+        order = layers[1:] if down else layers[-2::-1]
+        for l in order:
+            bary = {}
+            for v in l:
+                nbrs = pred[v] if down else succ[v]
+                bary[v] = sum(pos[u] for u in nbrs) / len(nbrs) if nbrs else pos[v]
+            totals = {}
+            for v in l:
+                for g in chain[v]:
+                    t = totals.setdefault(g, [0.0, 0])
+                    t[0] += bary[v]
+                    t[1] += 1
+            l.sort(key=lambda v: [totals[g][0] / totals[g][1] for g in chain[v]] + [bary[v]])
+            for i, v in enumerate(l):
+                pos[v] = (i + 0.5) / len(l)
+
+    # ── Coordinates: main axis = layers, cross axis = order within a layer ──
+    depth = max((len(c) for c in chain), default=0)
+    if direction == "auto" and layers:
+        direction = _orientation(len(layers), max(len(l) for l in layers), width, height, node_size)
+    if direction == "LR":
+        main, cross = width, height
+        node_main, node_cross = node_size[0], node_size[1]
+    else:
+        main, cross = height, width
+        node_main, node_cross = node_size[1], node_size[0]
+    main_start = depth * (GROUP_LABEL if direction != "LR" else GROUP_PAD)
+    main_size = main - main_start - depth * GROUP_PAD
+    cross_start = depth * (GROUP_PAD if direction != "LR" else GROUP_LABEL)
+    cross_size = cross - cross_start - depth * GROUP_PAD
+
+    rects = {}
+    if layers:
+        band = main_size / len(layers)
+        node_m = int(min(node_main, band * (0.6 if groups else 0.75)))
+        widest = max(len(l) for l in layers)
+        gap = min(NODE_GAP, cross_size * 0.15 / widest)
+        node_c = int(min(node_cross, (cross_size - (widest - 1) * gap) / widest))
+        offset = (band - node_m) * (1.0 if groups else 0.5)   # group labels sit in the gap
+        for li, l in enumerate(layers):
+            m = int(main_start + li * band + offset)
+            slot = cross_size / len(l)
+            for i, v in enumerate(l):
+                c = int(cross_start + (i + 0.5) * slot - node_c / 2)
+                rects[ids[v]] = [m, c, node_m, node_c] if direction == "LR" else [c, m, node_c, node_m]
+
+    # ── Group boxes, innermost first ──
+    group_rects = {}
+    for gid, _, members in sorted(groups, key=lambda g: -_depth(g[0], parent)):
+        inner = [rects.get(m) or group_rects.get(m) for m in members]
+        inner = [r for r in inner if r]
+        if not inner:
+            continue
+        x0 = min(r[0] for r in inner)
+        y0 = min(r[1] for r in inner)
+        x1 = max(r[0] + r[2] for r in inner)
+        y1 = max(r[1] + r[3] for r in inner)
+        x0, y0 = x0 - GROUP_PAD, y0 - GROUP_LABEL
+        group_rects[gid] = [x0, y0, x1 + GROUP_PAD - x0, y1 + GROUP_PAD - y0]
+    return {"nodes": rects, "groups": group_rects, "layers": len(layers), "direction": direction}
+
+
+def _orientation(n_layers, widest, width, height, node_size):
+    """"TB" or "LR", whichever lets nodes come closer to node_size."""
+    def scale(main, cross, node_main, node_cross):
+        return min(main / n_layers * 0.75 / node_main, cross / widest / node_cross, 1.0)
+    tb = scale(height, width, node_size[1], node_size[0])
+    lr = scale(width, height, node_size[0], node_size[1])
+    return "LR" if lr > tb else "TB"
+
+
+def _depth(gid, parent):
+    d, seen = 0, set()
+    while gid in parent and gid not in seen:
+        seen.add(gid)
+        gid = parent[gid]
+        d += 1
+    return d
+
+
+def _break_cycles(succ):
+    """Reverse the back edges of an iterative DFS, leaving a DAG."""
+    n = len(succ)
+    state = [0] * n                                  # 0 new, 1 on stack, 2 done
+    out = [[] for _ in range(n)]
+    for root in range(n):
+        if state[root]:
+            continue
+        state[root] = 1
+        stack = [(root, iter(succ[root]))]
+        while stack:
+            u, it = stack[-1]
+            for v in it:
+                if state[v] == 1:
+                    out[v].append(u)                 # back edge: flip it
+                else:
+                    out[u].append(v)
+                    if not state[v]:
+                        state[v] = 1
+                        stack.append((v, iter(succ[v])))
+                        break
+            else:
+                state[u] = 2
+                stack.pop()
+    return out
+
+
+# ══════════════════════════════════════════════════════════════
+# ASCII DIAGRAMS -- the box-drawing blocks in the markdown docs
+# ══════════════════════════════════════════════════════════════
+H_EDGE = "─┬┴┼━═"
+V_EDGE = "│├┤┼┃║"
+ARROWS = "▼▲▶◀►◄→←↓↑"
+CONNECT = "│─┼┬┴├┤┌┐└┘" + ARROWS
+_JUNK = re.compile(r"[│─┼┬┴├┤┌┐└┘▼▲▶◀►◄]")
+
+
+def _at(grid, r, c):
+    return grid[r][c] if 0 <= r < len(grid) and 0 <= c < len(grid[r]) else " "
+
+
+def _edge_near(grid, r, c, spread):
+    """Column of a vertical border char at row r within `spread` of c, or None."""
+    for dc in spread:
+        if _at(grid, r, c + dc) in V_EDGE:
+            return c + dc
+    return None
+
+
+def _find_boxes(grid):
+    """(top, left, bottom, right) of every closed box. Borders in the docs
+    drift by a column here and there (a wide label pushes the rest of its
+    row over), so side edges only have to stay within a column of true."""
+    boxes = []
+    for r, row in enumerate(grid):
+        for c, ch in enumerate(row):
+            if ch != "┌":
+                continue
+            c1 = c + 1
+            while _at(grid, r, c1) in H_EDGE:
+                c1 += 1
+            if c1 == c + 1 or _at(grid, r, c1) != "┐":
+                continue
+            r1 = r + 1
+            while _edge_near(grid, r1, c, (0, 1, -1)) is not None:
+                r1 += 1
+            if r1 == r + 1 or _at(grid, r1, c) != "└":
+                continue
+            c2 = c + 1
+            while _at(grid, r1, c2) in H_EDGE:
+                c2 += 1
+            if _at(grid, r1, c2) == "┘":
+                boxes.append((r, c, r1, max(c1, c2)))
+    return boxes
+
+
+def _label(lines):
+    """Title lines of a box -> (label, detail). "HUMAN" over "REVIEW" and
+    "Script" over "Agent" are one label; "Worker 1" over "Chrome" is not."""
+    k = 1
+    while k < len(lines) and (lines[k - 1].isupper() and lines[k].isupper()
+                              or " " not in lines[k - 1] and lines[k][:1].isupper()):
+        k += 1
+    return " ".join(lines[:k]), " ".join(lines[k:])
+
+
+def parse_ascii(text):
+    """(nodes, edges, groups) for a box-drawing diagram, or None when the
+    block is not one (fewer than two boxes, or nothing connects them)."""
+    grid = text.splitlines()
+    boxes = _find_boxes(grid)
+    if len(boxes) < 2:
+        return None
+
+    # ── Nesting: a box's parent is the smallest box around it ──
+    def inside(a, b):
+        return b[0] < a[0] and a[2] < b[2] and b[1] < a[1] and a[3] <= b[3] + 1
+
+    parent = {}
+    for i, a in enumerate(boxes):
+        around = [j for j, b in enumerate(boxes) if j != i and inside(a, b)]
+        if around:
+            parent[i] = min(around, key=lambda j: (boxes[j][2] - boxes[j][0]) * (boxes[j][3] - boxes[j][1]))
+    kids = {}
+    for i, p in parent.items():
+        kids.setdefault(p, []).append(i)
+
+    # ── Border cells -> owning box ──
+    border = {}
+    for i, (r0, c0, r1, c1) in enumerate(boxes):
+        for c in range(c0, c1 + 1):
+            for r in (r0, r1):
+                if _at(grid, r, c) in H_EDGE + "┌┐└┘":
+                    border[(r, c)] = i
+        for r in range(r0 + 1, r1):
+            for c in (_edge_near(grid, r, c0, (0, 1, -1)), _edge_near(grid, r, c1, (0, 1, -1, 2, -2))):
+                if c is not None:
+                    border[(r, c)] = i
+
+    # ── Labels: text inside a box, minus its child boxes ──
+    def lines_of(i):
+        r0, c0, r1, c1 = boxes[i]
+        out = []
+        for r in range(r0 + 1, r1):
+            left = _edge_near(grid, r, c0, (0, 1, -1))
+            right = _edge_near(grid, r, c1, (0, 1, -1, 2, -2))
+            left = c0 if left is None else left
+            right = c1 if right is None else right
+            row = list(" " * (left - c0) + grid[r][left + 1:right])
+            for k in kids.get(i, ()):
+                kr0, kc0, kr1, kc1 = boxes[k]
+                if kr0 <= r <= kr1:
+                    for c in range(max(kc0 - 1, c0 + 1), min(kc1 + 2, c0 + 1 + len(row))):
+                        row[c - c0 - 1] = " "
+            line = " ".join(_JUNK.sub(" ", "".join(row)).split())
+            if line:
+                out.append(line)
+        return out
+
+    ids = {i: (f"g{i}" if i in kids else f"n{i}") for i in range(len(boxes))}
+    nodes, groups = [], []
+    for i in range(len(boxes)):
+        lines = lines_of(i)
+        if i in kids:
+            groups.append((ids[i], lines[0] if lines else "", [ids[k] for k in sorted(kids[i])]))
+        else:
+            nodes.append((ids[i],) + _label(lines))
+
+    # ── Connectors: each run of line/arrow cells joins the boxes it touches ──
+    def ancestor(a, b):
+        while b in parent:
+            b = parent[b]
+            if b == a:
+                return True
+        return False
+
+    edges, done = [], set()
+    for r, row in enumerate(grid):
+        for c, ch in enumerate(row):
+            if ch not in CONNECT or (r, c) in border or (r, c) in done:
+                continue
+            touched, targets, stack = set(), set(), [(r, c)]
+            done.add((r, c))
+            while stack:
+                cr, cc = stack.pop()
+                for nr, nc in ((cr - 1, cc), (cr + 1, cc), (cr, cc - 1), (cr, cc + 1)):
+                    if (nr, nc) in border:
+                        touched.add(border[(nr, nc)])
+                        if _at(grid, cr, cc) in ARROWS:
+                            targets.add(border[(nr, nc)])
+                    elif _at(grid, nr, nc) in CONNECT and (nr, nc) not in done:
+                        done.add((nr, nc))
+                        stack.append((nr, nc))
+            if len(touched) < 2:
+                continue
+            if targets:
+                sources = touched - targets
+            else:                                    # no arrowhead: read top-down, left-right
+                first = min(touched, key=lambda i: boxes[i][:2])
+                sources, targets = {first}, touched - {first}
+            for a in sorted(sources):
+                for b in sorted(targets):
+                    if a != b and not ancestor(a, b) and not ancestor(b, a) and (a, b) not in edges:
+                        edges.append((a, b))
+    if not edges or len(nodes) < 2:
+        return None
+    return nodes, [(ids[a], ids[b]) for a, b in edges], groups
+
+
+# ══════════════════════════════════════════════════════════════
+# BENCHMARK / INSPECTION
+# ══════════════════════════════════════════════════════════════
+def _random_graph(n, seed=7):
+    rng = random.Random(seed)
+    nodes = [f"n{i}" for i in range(n)]
+    edges = [(f"n{rng.randrange(i)}", f"n{i}") for i in range(1, n)]
+    edges += [(f"n{rng.randrange(n)}", f"n{rng.randrange(n)}") for _ in range(n // 2)]
+    groups = [(f"g{k}", f"Group {k}", nodes[k * 10:k * 10 + 10]) for k in range(n // 40)]
+    return nodes, edges, groups
+
+
+def bench(largest=800):
+    n = 100
+    while n <= largest:
+        nodes, edges, groups = _random_graph(n)
+        _cache.clear()
+        start = time.perf_counter()
+        result = layout(nodes, edges, 12 * EMU, 5 * EMU, groups)
+        cold = time.perf_counter() - start
+        start = time.perf_counter()
+        layout(nodes, edges, 12 * EMU, 5 * EMU, groups)
+        warm = time.perf_counter() - start
+        print(f"  {n:5d} nodes {len(edges):5d} edges  {result['layers']:3d} layers   "
+              f"layout {cold * 1000:7.1f} ms   cached {warm * 1000:6.2f} ms   "
+              f"({cold / n * 1e6:.0f} us/node)")
+        n *= 2
+
+
+def main(argv):
+    if len(argv) > 1 and argv[1] == "--bench":
+        bench(int(argv[2]) if len(argv) > 2 else 800)
+    elif len(argv) > 2 and argv[1] == "--ascii":
+        with open(argv[2], encoding="utf-8") as f:
+            text = f.read()
+        for block in re.findall(r"```[^\n]*\n(.*?)```", text, re.S):
+            parsed = parse_ascii(block)
+            if parsed is None:
+                continue
+            nodes, edges, groups = parsed
+            print(f"{len(nodes)} nodes, {len(edges)} edges, {len(groups)} groups")
+            labels = {n[0]: n[1] for n in nodes}
+            labels.update((g[0], g[1]) for g in groups)
+            for gid, label, members in groups:
+                print(f"  [{label}] " + ", ".join(labels[m] for m in members))
+            for a, b in edges:
+                print(f"  {labels[a]} -> {labels[b]}")
+    else:
+        print(__doc__.strip())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,529 @@
+"""
+Deck import -- existing .pptx files back to slide specs
+Streams each slide's XML and rebuilds what the generator can draw again.
+
+Usage:
+    python import_pptx.py "AI Agent Testing.pptx" -o specs/         (one .spec per deck)
+    python import_pptx.py archive/ -o specs/ [--workers 8]            (bulk, recursive)
+    python import_pptx.py deck.pptx --render copy.pptx                (round trip check)
+
+Slide parts are read with iterparse straight out of the zip, and every
+top-level shape is cleared once it has been turned into a spec, so memory
+stays flat however big the deck is. Mapping:
+
+    title / subtitle      -- text in the generator's title or subtitle style,
+                             or title / subTitle placeholders
+    bullet list           -- paragraphs with bullet characters (buChar or a
+                             typed "•"); a bold first run keeps "Label -- text"
+    text box              -- any other text
+    table                 -- first row headers, the rest rows
+    rectangle             -- autoshapes (their text becomes a text box on top)
+    section box           -- the generator's panel + heading + bullets trio
+
+Placeholders take position and font size from their layout / master.
+Decks on another canvas (4:3 and so on) are scaled to the generator's
+13.333 x 7.5 in. Pictures, connectors, charts and grouped shapes are
+counted as skipped.
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from lxml import etree
+
+import slide_spec
+from merge_pptx import NS_P, RT_LAYOUT, RT_MASTER, Package, qn
+from slide_spec import (BLACK, BLUE, CENTER, DARK, GRAY, LEFT, LIGHT_GRAY, NO_COLOR, PANEL,
+                        RIGHT, BulletList, SectionBox, Shape, Slide, Subtitle, Table, TextBox,
+                        Title)
+from rich_text import CODE_FONT, COLORS, escape
+
+NS_A = "http://schemas.openxmlformats.org/drawingml/2006/main"
+EMU = 914400
+SLIDE_W, SLIDE_H = int(13.333 * EMU), int(7.5 * EMU)      # generate_pptx canvas
+NEAR = 2000                                                # EMU slack when matching layouts
+BULLETS = "•▪‣◦-–*"
+ALIGN = {"l": LEFT, "ctr": CENTER, "r": RIGHT}
+
+_SP, _FRAME, _CXN, _PIC, _GRP = (qn(NS_P, t) for t in ("sp", "graphicFrame", "cxnSp", "pic", "grpSp"))
+_SPTREE = qn(NS_P, "spTree")
+_A = {t: qn(NS_A, t) for t in ("p", "r", "t", "br", "rPr", "pPr", "defRPr", "endParaRPr", "off",
+                                "ext", "xfrm", "solidFill", "srgbClr", "noFill", "ln", "prstGeom",
+                                "buChar", "buNone", "tbl", "tr", "tc", "spcBef", "spcPts",
+                                "normAutofit", "lstStyle", "lvl1pPr", "bodyPr", "fld", "latin")}
+_COLOR_NAMES = {rgb: name for name, rgb in COLORS.items()}
+
+
+def _find(el, *path):
+    for tag in path:
+        if el is None:
+            return None
+        el = el.find(tag)
+    return el
+
+
+# ══════════════════════════════════════════════════════════════
+# PLACEHOLDERS -- geometry and font size inherited from layout / master
+# ══════════════════════════════════════════════════════════════
+class _Inherited:
+    """Placeholder lookups for one package; layouts and masters are small and
+    parsed once each (only slide parts are streamed)."""
+
+    def __init__(self, pkg):
+        self.pkg = pkg
+        self.parts = {}
+
+    def _part(self, name):
+        if name not in self.parts:
+            root = etree.fromstring(self.pkg.read(name))
+            phs = []
+            for sp in root.iter(_SP):
+                ph = sp.find(f"{qn(NS_P, 'nvSpPr')}/{qn(NS_P, 'nvPr')}/{qn(NS_P, 'ph')}")
+                if ph is not None:
+                    phs.append((ph.get("type", "body"), ph.get("idx", "0"), _xfrm(sp), _list_size(sp)))
+            parent = next((t for _, rt, t, _ in self.pkg.rels(name) if rt == RT_MASTER), None)
+            styles = {}
+            tx = root.find(qn(NS_P, "txStyles"))
+            if tx is not None:
+                for kind in ("titleStyle", "bodyStyle"):
+                    rpr = _find(tx.find(qn(NS_P, kind)), _A["lvl1pPr"], _A["defRPr"])
+                    if rpr is not None and rpr.get("sz"):
+                        styles[kind] = int(rpr.get("sz")) // 100
+            self.parts[name] = (phs, parent, styles)
+        return self.parts[name]
+
+    def lookup(self, part, ph_type, idx):
+        """(xfrm or None, font size or None) for a placeholder, walking up."""
+        xfrm = size = None
+        name = part
+        while name and (xfrm is None or size is None):
+            phs, parent, styles = self._part(name)
+            for t, i, x, s in phs:
+                same = (i == idx and idx != "0") or (t == ph_type) or \
+                       (ph_type == "ctrTitle" and t == "title") or (ph_type == "subTitle" and t == "body")
+                if same:
+                    xfrm, size = xfrm or x, size or s
+                    break
+            if size is None and styles:
+                size = styles.get("titleStyle" if ph_type in ("title", "ctrTitle") else "bodyStyle")
+            name = parent
+        return xfrm, size
+
+
+def _layout_of(pkg, slide_part):
+    return next((t for _, rt, t, _ in pkg.rels(slide_part) if rt == RT_LAYOUT), None)
+
+
+# ══════════════════════════════════════════════════════════════
+# SHAPE READERS
+# ══════════════════════════════════════════════════════════════
+def _xfrm(el):
+    """(x, y, cx, cy) of a shape or graphic frame, or None if inherited."""
+    for xfrm in el.iter(_A["xfrm"], qn(NS_P, "xfrm")):
+        off, ext = xfrm.find(_A["off"]), xfrm.find(_A["ext"])
+        if off is not None and ext is not None:
+            return (int(off.get("x")), int(off.get("y")), int(ext.get("cx")), int(ext.get("cy")))
+        return None
+    return None
+
+
+def _list_size(sp):
+    rpr = _find(sp.find(qn(NS_P, "txBody")), _A["lstStyle"], _A["lvl1pPr"], _A["defRPr"])
+    return int(rpr.get("sz")) // 100 if rpr is not None and rpr.get("sz") else None
+
+
+def _rgb(el, default):
+    """srgbClr inside el's own solidFill; theme colors fall back to `default`."""
+    fill = el.find(_A["solidFill"]) if el is not None else None
+    clr = fill.find(_A["srgbClr"]) if fill is not None else None
+    return int(clr.get("val"), 16) if clr is not None else default
+
+
+def _text(p):
+    return "".join(el.text or "" if el.tag == _A["t"] else "\n" for el in p.iter(_A["t"], _A["br"]))
+
+
+def _props(p):
+    """Font props of a paragraph: its defaults, gaps filled from the first run."""
+    run = p.find(_A["r"])
+    layers = [run.find(_A["rPr"]) if run is not None else None, _find(p, _A["pPr"], _A["defRPr"])]
+    props = {"sz": None, "b": None, "i": None, "color": None}
+    for rpr in layers:
+        if rpr is None:
+            continue
+        if rpr.get("sz"):
+            props["sz"] = int(rpr.get("sz")) // 100
+        for flag in ("b", "i"):
+            if rpr.get(flag) is not None:
+                props[flag] = rpr.get(flag) in ("1", "true")
+        props["color"] = _rgb(rpr, props["color"])
+    ppr = p.find(_A["pPr"])
+    props["algn"] = ALIGN.get(ppr.get("algn") if ppr is not None else None, LEFT)
+    return props
+
+
+def _style(rpr, into):
+    """Apply one rPr / defRPr's bold, italic, color and typeface onto `into`."""
+    if rpr is None:
+        return into
+    for flag in ("b", "i"):
+        if rpr.get(flag) is not None:
+            into[flag] = rpr.get(flag) in ("1", "true")
+    into["color"] = _rgb(rpr, into["color"])
+    latin = rpr.find(_A["latin"])
+    if latin is not None:
+        into["font"] = latin.get("typeface")
+    return into
+
+
+def _runs(p):
+    """(text, style) per run of a paragraph, the run's rPr over the paragraph's
+    defRPr; a line break is ("\n", None)."""
+    defaults = _style(_find(p, _A["pPr"], _A["defRPr"]),
+                      {"b": False, "i": False, "color": None, "font": None})
+    runs = []
+    for el in p:
+        if el.tag in (_A["r"], _A["fld"]):
+            t = el.find(_A["t"])
+            runs.append(((t.text or "") if t is not None else "",
+                         _style(el.find(_A["rPr"]), dict(defaults))))
+        elif el.tag == _A["br"]:
+            runs.append(("\n", None))
+    return runs
+
+
+def _markup(runs, base):
+    """rich_text markup for runs: what differs from `base` (bold / italic /
+    color, as from _props) or uses the code font is wrapped, the rest escaped."""
+    spans = []
+    for text, props in runs:
+        style = (False, False, False, None)
+        if props is not None:
+            color = props["color"]
+            style = (props["b"] and not base["b"],
+                     props["i"] and not base["i"],
+                     props["font"] == CODE_FONT and "`" not in text,
+                     color if color not in (None, base["color"]) else None)
+        if spans and spans[-1][1] == style and text != "\n" and spans[-1][0] != "\n":
+            spans[-1][0] += text
+        else:
+            spans.append([text, style])
+
+    out = []
+    for text, (bold, italic, code, color) in spans:
+        core = text.strip()
+        if not core or text == "\n":
+            out.append(text)
+            continue
+        lead, trail = text[:len(text) - len(text.lstrip())], text[len(text.rstrip()):]
+        core = f"`{core}`" if code else escape(core)
+        if italic:
+            core = f"*{core}*"
+        if bold:
+            core = f"**{core}**"
+        if color is not None:
+            core = f"{{{_COLOR_NAMES.get(color, f'#{color:06X}')}|{core}}}"
+        out.append(lead + core + trail)
+    return "".join(out)
+
+
+def _is_bullet(p):
+    ppr = p.find(_A["pPr"])
+    if ppr is not None and ppr.find(_A["buChar"]) is not None:
+        return True
+    return _text(p).lstrip()[:1] in BULLETS and len(_text(p).strip()) > 1
+
+
+def _bullet_item(p, color):
+    runs = _runs(p)
+    base = {"b": False, "i": False, "color": color}
+    # bullet_list's "Label -- text": every run up to the one ending " -- " is bold
+    split = 0
+    for k, (text, props) in enumerate(runs):
+        if props is None or not props["b"]:
+            break
+        if text.endswith(" -- "):
+            split = k + 1
+            break
+    text = _markup(runs[:split], dict(base, b=True)) + _markup(runs[split:], base)
+    if text.startswith("  "):                 # bullet_list pads every item with two spaces
+        return text[2:]
+    return text.lstrip().lstrip(BULLETS).strip()
+
+
+def _text_shape(sp, geom, default_size, ph_type):
+    """[Title] / [Subtitle] / [BulletList] / [TextBox, ...] for a shape's txBody."""
+    body = sp.find(qn(NS_P, "txBody"))
+    if body is None:
+        return []
+    paras = [p for p in body.iter(_A["p"])]
+    texts = [_text(p) for p in paras]
+    if not any(t.strip() for t in texts):
+        return []
+    first = next(p for p, t in zip(paras, texts) if t.strip())
+    props = _props(first)
+    scale = _find(body, _A["bodyPr"], _A["normAutofit"])
+
+    def scaled(sz):
+        if scale is not None and scale.get("fontScale"):
+            return max(6, round(sz * int(scale.get("fontScale")) / 100000))
+        return sz
+
+    size = scaled(props["sz"] or default_size or 18)
+    x, y, w, h = geom
+    text = "\n".join(_markup(_runs(p), props).strip("\n") for p in paras).strip()
+
+    if ph_type in ("title", "ctrTitle"):
+        return [Title(" ".join(text.split()), top=y)]
+    if ph_type == "subTitle":
+        return [Subtitle(" ".join(text.split()), top=y)]
+    if abs(x - int(0.6 * EMU)) < NEAR and abs(w - 12 * EMU) < NEAR and len(paras) == 1:
+        if size == 30 and props["b"] and props["color"] == BLUE:
+            return [Title(text, top=y)]
+        if size == 16 and props["i"] and props["color"] == GRAY:
+            return [Subtitle(text, top=y)]
+
+    items = [p for p, t in zip(paras, texts) if t.strip()]
+    if all(_is_bullet(p) for p in items):
+        ppr = first.find(_A["pPr"])
+        spacing = _find(ppr, _A["spcBef"], _A["spcPts"])
+        color = props["color"] if props["color"] is not None else BLACK
+        return [BulletList(x, y, w, [_bullet_item(p, color) for p in items], size=size,
+                           color=color,
+                           spacing=int(spacing.get("val")) // 100 if spacing is not None else 4)]
+
+    # Paragraphs styled differently (a diagram node's label over its detail line):
+    # bold / italic / color differences become markup against the group's common
+    # style; a change of size or alignment, which markup can't say, starts a new
+    # text box. Boxes share the shape's height in proportion to their font size.
+    groups = []                                   # [[size, align, [(p, props)]]]
+    for p, t in zip(paras, texts):
+        pp = _props(p)
+        if not t.strip() and groups:              # blank lines stay where they are
+            groups[-1][2].append((p, pp))
+            continue
+        key = (scaled(pp["sz"]) if pp["sz"] else size, pp["algn"])
+        if groups and tuple(groups[-1][:2]) == key:
+            groups[-1][2].append((p, pp))
+        else:
+            groups.append([*key, [(p, pp)]])
+    weights = [g_size * sum(1 for p, _ in members if _text(p).strip()) for g_size, _, members in groups]
+    out, top = [], y
+    for (g_size, align, members), weight in zip(groups, weights):
+        styled = [pp for p, pp in members if _text(p).strip()]
+        base = {"b": all(pp["b"] for pp in styled), "i": all(pp["i"] for pp in styled),
+                "color": styled[0]["color"]}
+        body_text = "\n".join(_markup(_runs(p), base).strip("\n") for p, _ in members).strip()
+        height = h if len(groups) == 1 else int(h * weight / sum(weights))
+        out.append(TextBox(x, top, w, height, body_text, size=g_size,
+                           color=base["color"] if base["color"] is not None else BLACK,
+                           bold=base["b"], align=align, italic=base["i"]))
+        top += height
+    return out
+
+
+def _rectangle(sp, geom):
+    sppr = sp.find(qn(NS_P, "spPr"))
+    fill = NO_COLOR if sppr is not None and sppr.find(_A["noFill"]) is not None else _rgb(sppr, PANEL)
+    ln = sppr.find(_A["ln"]) if sppr is not None else None
+    if ln is None:
+        line = LIGHT_GRAY
+    elif ln.find(_A["noFill"]) is not None:
+        line = NO_COLOR
+    else:
+        line = _rgb(ln, LIGHT_GRAY)
+    return Shape(*geom, fill=fill, line=line)
+
+
+def _table(frame, geom):
+    tbl = next(frame.iter(_A["tbl"]), None)
+    if tbl is None:
+        return None
+    rows = [[" ".join(_markup(_runs(p), _props(p)).strip() for p in tc.iter(_A["p"])
+                      if _text(p).strip())
+             for tc in tr.iter(_A["tc"])] for tr in tbl.iter(_A["tr"])]
+    if not rows:
+        return None
+    first_tr = tbl.find(_A["tr"])
+    first_p = next(tbl.iter(_A["p"]), None)
+    size = (_props(first_p)["sz"] if first_p is not None else None) or 12
+    x, y, w, _ = geom
+    cols = len(rows[0])
+    return Table(x, y, w, int(first_tr.get("h", 0)), rows[0],
+                 [(r + [""] * cols)[:cols] for r in rows[1:]], font_size=size)
+
+
+# ══════════════════════════════════════════════════════════════
+# SLIDES
+# ══════════════════════════════════════════════════════════════
+def _scale(geom, sx, sy):
+    x, y, w, h = geom
+    return int(x * sx), int(y * sy), int(w * sx), int(h * sy)
+
+
+def _near(a, b):
+    return abs(a - b) < NEAR
+
+
+def _fold(elements):
+    """Turn the generator's composites back into single elements: drop the
+    bar add_title draws, and rebuild section_box from panel + heading + list."""
+    out, i = [], 0
+    while i < len(elements):
+        el = elements[i]
+        nxt = elements[i + 1:i + 3]
+        if (type(el) is Shape and out and type(out[-1]) is Title and el.fill == BLUE
+                and _near(el.top, out[-1].top + int(0.65 * EMU)) and _near(el.width, int(2.5 * EMU))):
+            i += 1
+            continue
+        if (type(el) is Shape and el.fill == PANEL and el.line == LIGHT_GRAY and len(nxt) == 2
+                and type(nxt[0]) is TextBox and type(nxt[1]) is BulletList
+                and nxt[0].bold and nxt[0].color == BLUE and nxt[1].color == DARK
+                and _near(nxt[0].left, el.left + int(0.15 * EMU))
+                and _near(nxt[0].top, el.top + int(0.08 * EMU))
+                and _near(nxt[1].top, el.top + int(0.45 * EMU))):
+            out.append(SectionBox(el.left, el.top, el.width, el.height, nxt[0].text,
+                                  nxt[1].items, title_size=nxt[0].size))
+            i += 3
+            continue
+        out.append(el)
+        i += 1
+    return out
+
+
+def read_slide(stream, number, inherited=None, part=None, scale=(1.0, 1.0)):
+    """Slide spec for one slide part, streamed. Returns (Slide, skipped shapes)."""
+    elements, skipped = [], 0
+    sx, sy = scale
+    for _, el in etree.iterparse(stream, events=("end",), tag=(_SP, _FRAME, _CXN, _PIC, _GRP)):
+        parent = el.getparent()
+        if parent is None or parent.tag != _SPTREE:
+            continue                              # inside a group: cleared with it
+        if el.tag == _SP:
+            ph = el.find(f"{qn(NS_P, 'nvSpPr')}/{qn(NS_P, 'nvPr')}/{qn(NS_P, 'ph')}")
+            ph_type = ph.get("type", "body") if ph is not None else None
+            geom, default_size = _xfrm(el), None
+            if ph is not None and inherited is not None:
+                inherited_geom, default_size = inherited.lookup(_layout_of(inherited.pkg, part),
+                                                                ph_type, ph.get("idx", "0"))
+                geom = geom or inherited_geom
+            if geom is None:
+                skipped += 1
+            else:
+                geom = _scale(geom, sx, sy)
+                geometry = _find(el, qn(NS_P, "spPr"), _A["prstGeom"])
+                if ph is None and geometry is not None and el.find(
+                        f"{qn(NS_P, 'nvSpPr')}/{qn(NS_P, 'cNvSpPr')}").get("txBox") != "1":
+                    elements.append(_rectangle(el, geom))
+                elements += _text_shape(el, geom, default_size, ph_type)
+        elif el.tag == _FRAME and next(el.iter(_A["tbl"]), None) is not None:
+            geom = _xfrm(el)
+            table = _table(el, _scale(geom, sx, sy)) if geom else None
+            if table is None:
+                skipped += 1
+            else:
+                elements.append(table)
+        else:
+            skipped += 1
+        el.clear()                                # bounded memory: drop what we've read
+        while el.getprevious() is not None:
+            del parent[0]
+    return Slide(number, _fold(elements)), skipped
+
+
+def iter_slides(path):
+    """Yield (Slide, skipped) for each slide of the deck at `path`."""
+    pkg = Package(path)
+    try:
+        pres = etree.fromstring(pkg.read(pkg.main_part()))
+        size = pres.find(qn(NS_P, "sldSz"))
+        scale = ((SLIDE_W / int(size.get("cx")), SLIDE_H / int(size.get("cy")))
+                 if size is not None else (1.0, 1.0))
+        inherited = _Inherited(pkg)
+        for number, part in enumerate(pkg.slide_parts(), 1):
+            with pkg.zip.open(part.lstrip("/")) as stream:
+                yield read_slide(stream, number, inherited, part, scale)
+    finally:
+        pkg.close()
+
+
+def import_deck(path):
+    """([Slide], skipped shape count) for one deck."""
+    slides, skipped = [], 0
+    for slide, n in iter_slides(path):
+        slides.append(slide)
+        skipped += n
+    return slides, skipped
+
+
+def _convert(job):
+    src, dst = job
+    try:
+        slides, skipped = import_deck(src)
+    except Exception as e:                        # keep bulk runs going past a bad deck
+        return src, None, str(e)
+    os.makedirs(os.path.dirname(dst) or ".", exist_ok=True)
+    slide_spec.dump(slides, dst)
+    return src, (len(slides), sum(len(s.elements) for s in slides), skipped), dst
+
+
+def _jobs(paths, out_dir):
+    for path in paths:
+        if os.path.isdir(path):
+            for folder, _, names in os.walk(path):
+                for name in sorted(names):
+                    if name.lower().endswith(".pptx") and not name.startswith("~$"):
+                        src = os.path.join(folder, name)
+                        rel = os.path.relpath(src, path)
+                        yield src, os.path.join(out_dir, os.path.splitext(rel)[0] + ".spec")
+        else:
+            yield path, os.path.join(out_dir, os.path.splitext(os.path.basename(path))[0] + ".spec")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Import .pptx decks as slide specs.")
+    parser.add_argument("paths", nargs="+", help=".pptx files or folders")
+    parser.add_argument("-o", "--output", default="specs", help="folder for .spec files")
+    parser.add_argument("--render", metavar="PPTX", help="re-render a single deck with the generator")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    if args.render:
+        if len(args.paths) != 1 or os.path.isdir(args.paths[0]):
+            parser.error("--render takes a single deck")
+        import generate_pptx as g
+        slides, skipped = import_deck(args.paths[0])
+        deck = g.new_presentation()
+        slide_spec.render(slides, deck)
+        deck.save(args.render)
+        print(f"[OK] {args.render}: {len(slides)} slides re-rendered ({skipped} shape(s) skipped)")
+        return 0
+
+    started, done, failed = time.perf_counter(), 0, 0
+    jobs = list(_jobs(args.paths, args.output))
+    if len(jobs) < 4:
+        results = map(_convert, jobs)
+    else:
+        executor = ProcessPoolExecutor(args.workers)
+        results = executor.map(_convert, jobs, chunksize=4)
+    for src, counts, detail in results:
+        if counts is None:
+            failed += 1
+            print(f"[SKIP] {src}: {detail}")
+            continue
+        done += 1
+        if len(jobs) <= 20:
+            slides, elements, skipped = counts
+            print(f"[OK] {src} -> {detail}: {slides} slides, {elements} elements"
+                  + (f", {skipped} shape(s) skipped" if skipped else ""))
+    if len(jobs) >= 4:
+        executor.shutdown()
+    print(f"     {done} deck(s) imported, {failed} failed ({time.perf_counter() - started:.1f}s)")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
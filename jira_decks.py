@@ -0,0 +1,441 @@
+"""
+Per-story decks from Jira -- Module 1 (ingest, validate, normalize) feeding the deck builder
+One summary deck per story, for projects with thousands of stories.
+
+Usage:
+    python jira_decks.py build --export stories.json -o decks/
+    python jira_decks.py build --url https://jira.example.com --project PROJ -o decks/
+    python jira_decks.py build --url https://jira.example.com --ids PROJ-1,PROJ-7 -o decks/
+    python jira_decks.py build --export stories.json -o decks/ --index deck-index.sqlite
+    python jira_decks.py stub stories.json --port 8080      (local Jira stand-in)
+
+Fetching runs on asyncio over a fixed pool of keep-alive HTTP connections
+(bounded concurrency, retry with exponential backoff, Retry-After honoured).
+Normalized stories go through a bounded queue straight to a pool of render
+processes, so fetching page N+1 overlaps rendering the stories of page N.
+"""
+
+import argparse
+import asyncio
+import base64
+import html
+import http.client
+import json
+import os
+import random
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, quote, urlencode, urlsplit
+
+PAGE_SIZE = 100
+RETRY_STATUS = {429, 500, 502, 503, 504}
+REQUIRED = ("key", "summary")
+
+
+class JiraError(Exception):
+    """Non-retryable failure talking to Jira (auth, missing project, bad reply)."""
+
+
+class NotFound(JiraError):
+    """404 -- fatal for a project, a rejected story for a single issue key."""
+
+
+# ══════════════════════════════════════════════════════════════
+# HTTP -- pooled keep-alive connections driven from asyncio
+# ══════════════════════════════════════════════════════════════
+class HttpPool:
+    """`size` persistent connections shared by all requests.
+
+    http.client does the protocol work in the default thread pool; the asyncio
+    queue of idle connections is what bounds concurrency.
+    """
+
+    def __init__(self, base_url, size=8, headers=None, retries=5, backoff=0.5, timeout=30):
+        url = urlsplit(base_url)
+        self.scheme, self.host, self.port = url.scheme, url.hostname, url.port
+        self.prefix = url.path.rstrip("/")
+        self.size, self.retries, self.backoff, self.timeout = size, retries, backoff, timeout
+        self.headers = {"Accept": "application/json", **(headers or {})}
+        self.idle = None
+
+    def _connect(self):
+        cls = http.client.HTTPSConnection if self.scheme == "https" else http.client.HTTPConnection
+        return cls(self.host, self.port, timeout=self.timeout)
+
+    async def __aenter__(self):
+        self.idle = asyncio.Queue()
+        for _ in range(self.size):
+            self.idle.put_nowait(self._connect())
+        return self
+
+    async def __aexit__(self, *exc):
+        while not self.idle.empty():
+            self.idle.get_nowait().close()
+
+    def _request(self, conn, path):
+        conn.request("GET", self.prefix + path, headers=self.headers)
+        resp = conn.getresponse()
+        return resp.status, resp.getheader("Retry-After"), resp.read()
+
+    async def get_json(self, path):
+        for attempt in range(self.retries + 1):
+            conn = await self.idle.get()
+            try:
+                status, retry_after, body = await asyncio.to_thread(self._request, conn, path)
+            except (OSError, http.client.HTTPException):
+                # Dropped keep-alive socket or network blip: reconnect and retry
+                conn.close()
+                conn, status, retry_after, body = self._connect(), None, None, b""
+            finally:
+                self.idle.put_nowait(conn)
+
+            if status == 200:
+                return json.loads(body)
+            if status in (401, 403):
+                raise JiraError(f"{status} for {path} -- check the token and project permissions")
+            if status == 404:
+                raise NotFound(f"404 for {path} -- no such issue or project")
+            if status is not None and status not in RETRY_STATUS:
+                raise JiraError(f"{status} for {path}: {body[:200]!r}")
+            if attempt == self.retries:
+                break
+            delay = self.backoff * 2 ** attempt * (1 + random.random())
+            if retry_after and retry_after.isdigit():
+                delay = max(delay, int(retry_after))
+            await asyncio.sleep(delay)
+        raise JiraError(f"giving up on {path} after {self.retries + 1} attempts")
+
+
+# ══════════════════════════════════════════════════════════════
+# NORMALIZE -- raw Jira issue -> canonical story JSON
+# ══════════════════════════════════════════════════════════════
+_TAG = re.compile(r"<[^>]+>")
+_MACRO = re.compile(r"\{(?:code|noformat|quote|panel|color)(?::[^}]*)?\}")
+_HEADING = re.compile(r"^h[1-6]\.\s*", re.M)
+_AC_HEADER = re.compile(r"^\s*(?:#+\s*|\*+)?acceptance criteria\b.*$", re.I | re.M)
+_GHERKIN = re.compile(r"^\s*(given|when|then|and|but)\b", re.I)
+_BULLET = re.compile(r"^\s*(?:[-*#•]+|\d+[.)])\s+")
+
+
+def _adf_text(node):
+    """Flatten an Atlassian Document Format node (Jira REST v3) to plain text."""
+    if isinstance(node, str):
+        return node
+    if not isinstance(node, dict):
+        return ""
+    if node.get("type") == "text":
+        return node.get("text", "")
+    parts = [_adf_text(child) for child in node.get("content", [])]
+    sep = "\n" if node.get("type") in ("doc", "bulletList", "orderedList", "listItem") else ""
+    text = sep.join(parts)
+    return text + "\n" if node.get("type") in ("paragraph", "heading") else text
+
+
+def clean_text(value):
+    """Strip HTML and wiki macros, resolve entities, normalize whitespace."""
+    text = _adf_text(value) if isinstance(value, dict) else (value or "")
+    text = text.replace("\r\n", "\n").replace("\u00a0", " ")
+    text = _TAG.sub("", _HEADING.sub("", _MACRO.sub("", text)))
+    text = html.unescape(text)
+    lines = [" ".join(line.split()) for line in text.split("\n")]
+    return "\n".join(lines).strip()
+
+
+def acceptance_criteria(description):
+    """AC lines: the list under an 'Acceptance Criteria' heading, else Gherkin steps."""
+    match = _AC_HEADER.search(description)
+    if match:
+        criteria = []
+        for line in description[match.end():].split("\n"):
+            if not line.strip():
+                if criteria:
+                    break
+                continue
+            if line.rstrip().endswith(":") and criteria:
+                break
+            criteria.append(_BULLET.sub("", line).strip())
+        return criteria
+    return [line.strip() for line in description.split("\n") if _GHERKIN.match(line)]
+
+
+def _name(field):
+    return (field or {}).get("name", "") if isinstance(field, dict) else (field or "")
+
+
+def normalize(issue):
+    """Canonical story dict, or raise ValueError naming what's missing."""
+    fields = issue.get("fields", issue)
+    story = {
+        "key": issue.get("key", ""),
+        "summary": clean_text(fields.get("summary")),
+        "type": _name(fields.get("issuetype")) or "Story",
+        "status": _name(fields.get("status")),
+        "priority": _name(fields.get("priority")),
+        "labels": list(fields.get("labels") or []),
+        "components": [_name(c) for c in fields.get("components") or []],
+        "description": clean_text(fields.get("description")),
+    }
+    missing = [f for f in REQUIRED if not story[f]]
+    if missing:
+        raise ValueError(f"{story['key'] or '<no key>'}: missing {', '.join(missing)}")
+    story["acceptance_criteria"] = acceptance_criteria(story["description"])
+    story["flags"] = []
+    if not story["description"]:
+        story["flags"].append("Empty description -- incomplete story")
+    if not story["acceptance_criteria"]:
+        story["flags"].append("No acceptance criteria found -- needs human review")
+    return story
+
+
+# ══════════════════════════════════════════════════════════════
+# SOURCES -- yield raw issues
+# ══════════════════════════════════════════════════════════════
+def _issues(payload):
+    return payload.get("issues", []) if isinstance(payload, dict) else payload
+
+
+async def read_export(path, queue):
+    with open(path, encoding="utf-8") as f:
+        for issue in _issues(json.load(f)):
+            await queue.put(issue)
+
+
+async def fetch_project(pool, project, queue):
+    """Page through a project's issues; pages after the first are fetched concurrently."""
+    jql = f"project = {project} ORDER BY key"
+
+    def page(start):
+        return "/rest/api/2/search?" + urlencode(
+            {"jql": jql, "startAt": start, "maxResults": PAGE_SIZE,
+             "fields": "summary,description,issuetype,status,priority,labels,components"})
+
+    async def one(start):
+        for issue in _issues(await pool.get_json(page(start))):
+            await queue.put(issue)
+
+    first = await pool.get_json(page(0))
+    for issue in _issues(first):
+        await queue.put(issue)
+    total = first.get("total", 0)
+    await asyncio.gather(*(one(s) for s in range(PAGE_SIZE, total, PAGE_SIZE)))
+
+
+async def fetch_ids(pool, ids, queue):
+    """Fetch issues by key; an unknown key is queued as a rejection, not raised."""
+    async def one(key):
+        try:
+            issue = await pool.get_json(f"/rest/api/2/issue/{quote(key)}")
+        except NotFound:
+            issue = NotFound(f"{key}: no such issue (404)")
+        await queue.put(issue)
+
+    await asyncio.gather(*(one(k) for k in ids))
+
+
+# ══════════════════════════════════════════════════════════════
+# RENDER -- one summary deck per story (runs in worker processes)
+# ══════════════════════════════════════════════════════════════
+def render_story(story, out_dir):
+    from pptx.util import Inches
+    import generate_pptx as g
+    from optimize_pptx import optimize
+
+    esc = g.rich_text.escape                        # Jira text prints as typed, never as markup
+    deck = g.new_presentation()
+    s = g.new_slide(deck)
+    g.add_title(s, esc(f"{story['key']}: {story['summary']}"[:90]))
+    g.add_subtitle(s, esc("  |  ".join(v for v in (story["type"], story["status"],
+                                                    story["priority"]) if v)))
+
+    description = [line for line in story["description"].split("\n") if line][:7] or ["(empty)"]
+    g.section_box(s, Inches(0.6), Inches(1.6), Inches(5.7), Inches(3.4),
+                  "Description", [esc(line[:110]) for line in description])
+    criteria = story["acceptance_criteria"][:7] or ["(none found)"]
+    g.section_box(s, Inches(6.7), Inches(1.6), Inches(5.7), Inches(3.4),
+                  "Acceptance Criteria", [esc(line[:110]) for line in criteria])
+
+    rows = [["Labels", esc(", ".join(story["labels"])) or "-"],
+            ["Components", esc(", ".join(story["components"])) or "-"],
+            ["Acceptance criteria", str(len(story["acceptance_criteria"]))],
+            ["Validation", "; ".join(story["flags"]) or "Passed"]]
+    g.add_table(s, Inches(0.6), Inches(5.3), Inches(12), 0.35, ["Field", "Value"], rows)
+
+    path = os.path.join(out_dir, re.sub(r"[^\w.-]", "_", story["key"]) + ".pptx")
+    deck.save(path)
+    optimize(path)
+    return path
+
+
+# ══════════════════════════════════════════════════════════════
+# PIPELINE
+# ══════════════════════════════════════════════════════════════
+async def run_pipeline(produce, out_dir, workers=None, depth=200):
+    """`produce(queue)` pushes raw issues; normalized stories render as they arrive.
+
+    A story that fails (bad data, or a render error such as a full disk or a
+    file name too long) is counted and skipped: a consumer only ever stops on
+    its sentinel, so the producer can't be left blocked on a full queue.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    loop = asyncio.get_running_loop()
+    raw = asyncio.Queue(maxsize=depth)
+    stats = {"rendered": 0, "rejected": [], "failed": []}
+
+    async def consume(executor):
+        while True:
+            issue = await raw.get()
+            if issue is None:
+                return
+            if isinstance(issue, NotFound):          # from fetch_ids: unknown key
+                stats["rejected"].append(str(issue))
+                continue
+            try:
+                story = normalize(issue)
+            except ValueError as e:
+                stats["rejected"].append(str(e))
+                continue
+            except Exception as e:                   # not shaped like an issue at all
+                stats["rejected"].append(f"<malformed issue>: {type(e).__name__}: {e}")
+                continue
+            try:
+                await loop.run_in_executor(executor, render_story, story, out_dir)
+            except Exception as e:
+                stats["failed"].append(f"{story['key']}: {type(e).__name__}: {e}")
+                continue
+            stats["rendered"] += 1
+
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(workers) as executor:
+        # Twice as many consumers as processes keeps every worker busy
+        consumers = [asyncio.create_task(consume(executor)) for _ in range(workers * 2)]
+        try:
+            await produce(raw)
+        finally:
+            for _ in consumers:
+                await raw.put(None)
+            await asyncio.gather(*consumers)
+    return stats
+
+
+def _headers(args):
+    if args.user and args.token:
+        creds = base64.b64encode(f"{args.user}:{args.token}".encode()).decode()
+        return {"Authorization": f"Basic {creds}"}
+    if args.token:
+        return {"Authorization": f"Bearer {args.token}"}
+    return {}
+
+
+async def build(args):
+    if args.export:
+        async def produce(queue):
+            await read_export(args.export, queue)
+    else:
+        async def produce(queue):
+            async with HttpPool(args.url, size=args.connections, headers=_headers(args)) as pool:
+                if args.ids:
+                    await fetch_ids(pool, [k.strip() for k in args.ids.split(",") if k.strip()], queue)
+                else:
+                    await fetch_project(pool, args.project, queue)
+    return await run_pipeline(produce, args.output, args.workers)
+
+
+# ══════════════════════════════════════════════════════════════
+# STUB -- serves an export through the Jira REST endpoints used above
+# ══════════════════════════════════════════════════════════════
+def stub_server(export, port=8080, host="127.0.0.1"):
+    with open(export, encoding="utf-8") as f:
+        issues = _issues(json.load(f))
+    by_key = {i.get("key"): i for i in issues}
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"   # keep-alive, like the real thing
+
+        def _send(self, status, payload):
+            body = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            url = urlsplit(self.path)
+            if url.path.endswith("/rest/api/2/search"):
+                q = parse_qs(url.query)
+                start = int(q.get("startAt", ["0"])[0])
+                size = int(q.get("maxResults", [str(PAGE_SIZE)])[0])
+                self._send(200, {"startAt": start, "maxResults": size, "total": len(issues),
+                                 "issues": issues[start:start + size]})
+            elif "/rest/api/2/issue/" in url.path:
+                key = url.path.rsplit("/", 1)[-1]
+                if key in by_key:
+                    self._send(200, by_key[key])
+                else:
+                    self._send(404, {"errorMessages": ["Issue does not exist"]})
+            else:
+                self._send(404, {"errorMessages": ["Not found"]})
+
+        def log_message(self, *args):
+            pass
+
+    return ThreadingHTTPServer((host, port), Handler)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Jira stories -> one summary deck per story.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    b = sub.add_parser("build", help="ingest stories and render decks")
+    src = b.add_mutually_exclusive_group(required=True)
+    src.add_argument("--export", help="local JSON export (search response or list of issues)")
+    src.add_argument("--url", help="Jira base URL")
+    b.add_argument("--project", help="project key to batch-fetch")
+    b.add_argument("--ids", help="comma-separated issue keys to fetch")
+    b.add_argument("--user", default=os.environ.get("JIRA_USER"))
+    b.add_argument("--token", default=os.environ.get("JIRA_TOKEN"))
+    b.add_argument("--connections", type=int, default=8, help="HTTP pool size")
+    b.add_argument("--workers", type=int, default=None, help="render processes")
+    b.add_argument("-o", "--output", default="decks")
+    b.add_argument("--index", help="also update this search index (see search_pptx.py)")
+
+    st = sub.add_parser("stub", help="serve an export as a Jira-compatible API")
+    st.add_argument("export")
+    st.add_argument("--port", type=int, default=8080)
+
+    args = parser.parse_args(argv)
+    if args.command == "stub":
+        server = stub_server(args.export, args.port)
+        print(f"[OK] Stub Jira on http://127.0.0.1:{args.port}")
+        server.serve_forever()
+        return 0
+
+    if args.url and not (args.project or args.ids):
+        parser.error("--url needs --project or --ids")
+    started = time.perf_counter()
+    try:
+        stats = asyncio.run(build(args))
+    except JiraError as e:
+        print(f"[ERROR] {e}")
+        return 1
+    for reason in stats["rejected"]:
+        print(f"[SKIP] {reason}")
+    for reason in stats["failed"]:
+        print(f"[ERROR] {reason}")
+    print(f"[OK] {stats['rendered']} deck(s) in {args.output} "
+          f"({time.perf_counter() - started:.1f}s, {len(stats['rejected'])} rejected"
+          + (f", {len(stats['failed'])} failed" if stats["failed"] else "") + ")")
+    if args.index:
+        from search_pptx import SearchIndex
+        with SearchIndex(args.index) as index:
+            indexed, _, removed, errors = index.update([args.output], args.workers)
+        print(f"[OK] {args.index}: {indexed} deck(s) indexed, {removed} removed"
+              + (f", {len(errors)} unreadable" if errors else ""))
+    return 1 if stats["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,235 @@
+"""
+Geometry lint for generated decks
+Flags overlapping shapes, off-canvas shapes and text that will not fit its box.
+
+Usage:
+    python lint_pptx.py deck.pptx [deck2.pptx ...]
+
+Overlaps compare what is inked -- text without its frame insets and outer
+paragraph spacing -- so stacked text boxes whose padding touches are fine.
+Shapes that grow to fit their text (spAutoFit, as the generate_pptx helpers
+write them) are measured at their grown size and never overflow; overflow is
+reported for fixed-size frames and for tables.
+Every slide gets a uniform grid index (1in cells) of shape bounding boxes, so
+only shapes that share a cell are compared -- linting stays near-linear in the
+number of shapes, which keeps 5000-slide decks practical in CI.
+"""
+
+import math
+import sys
+from collections import namedtuple
+
+from pptx import Presentation
+from pptx.enum.shapes import MSO_SHAPE_TYPE
+from pptx.enum.text import MSO_AUTO_SIZE, PP_ALIGN
+from pptx.util import Emu, Inches, Pt
+
+CELL = Inches(1)                 # grid cell size
+TOLERANCE = Inches(0.05)         # overlaps thinner than this are ignored
+SLACK = Inches(0.1)              # overflow smaller than this is ignored
+AVG_CHAR_EM = 0.47               # average Calibri glyph width, in ems
+LINE_EM = 1.2                    # line height, in ems
+DEFAULT_SIZE = Pt(18)            # PowerPoint default when no size is set
+INSET_X = Inches(0.1)            # default text frame / cell insets
+INSET_Y = Inches(0.05)
+
+Issue = namedtuple("Issue", "slide kind shapes message")
+# left..bottom is the inked extent (text without its insets and outer paragraph
+# spacing); needed_bottom is where the text frame would have to end to fit it
+Box = namedtuple("Box", "index label left top right bottom needed_bottom declared_bottom text")
+
+
+# ── Text height estimation ─────────────────────────────────
+def _font_size(paragraph):
+    for run in paragraph.runs:
+        if run.font.size is not None:
+            return run.font.size
+    if paragraph.font.size is not None:
+        return paragraph.font.size
+    return DEFAULT_SIZE
+
+
+def _split(text):
+    return text.replace("\n", "\v").split("\v")
+
+
+def _lines(text, size, usable):
+    per_line = max(1, int(usable / (size * AVG_CHAR_EM)))
+    return sum(max(1, math.ceil(len(line) / per_line)) for line in _split(text))
+
+
+def text_width(text_frame, width, inset_x=INSET_X):
+    """Estimated width (EMU) actually inked by left-aligned text, capped at `width`."""
+    widest = 0
+    for p in text_frame.paragraphs:
+        if p.alignment not in (None, PP_ALIGN.LEFT):
+            return width
+        size = _font_size(p)
+        widest = max([widest] + [len(line) * size * AVG_CHAR_EM for line in _split(p.text)])
+    return min(width, int(widest + 2 * inset_x))
+
+
+def text_height(text_frame, width, inset_x=INSET_X, inset_y=INSET_Y):
+    """Estimated rendered height (EMU) of a text frame wrapped to `width`."""
+    usable = max(1, width - 2 * inset_x)
+    height = 2 * inset_y
+    for p in text_frame.paragraphs:
+        size = _font_size(p)
+        height += _lines(p.text, size, usable) * size * LINE_EM
+        height += (p.space_before or 0) + (p.space_after or 0)
+    return int(height)
+
+
+def _ink(text_frame, left, top, right, needed_bottom):
+    """Inked extent of a text frame laid out in left..right, top..needed_bottom."""
+    paragraphs = text_frame.paragraphs
+    return (left + INSET_X, top + INSET_Y + (paragraphs[0].space_before or 0),
+            max(left + INSET_X, right - INSET_X),
+            max(top + INSET_Y, needed_bottom - INSET_Y - (paragraphs[-1].space_after or 0)))
+
+
+def table_height(table):
+    """Estimated rendered height (EMU); rows grow to fit wrapped cell text."""
+    widths = [col.width for col in table.columns]
+    total = 0
+    for row in table.rows:
+        needed = max(text_height(cell.text_frame, widths[c])
+                     for c, cell in enumerate(row.cells))
+        total += max(row.height, needed)
+    return total
+
+
+# ── Shape collection ───────────────────────────────────────
+def _label(shape):
+    text = ""
+    if shape.has_text_frame:
+        text = shape.text_frame.text
+    elif getattr(shape, "has_table", False):
+        text = shape.table.cell(0, 0).text
+    text = " ".join(text.split())
+    return f'{shape.name} "{text[:30]}"' if text else shape.name
+
+
+def _boxes(slide):
+    boxes = []
+    for i, shape in enumerate(slide.shapes):
+        if shape.width is None or shape.height is None:
+            continue
+        left, top = shape.left or 0, shape.top or 0
+        right, bottom = left + shape.width, top + shape.height
+        needed = declared = bottom
+        text = False
+        if shape.has_text_frame and shape.text_frame.text.strip():
+            text = True
+            if shape.text_frame.word_wrap is not False:
+                needed = top + text_height(shape.text_frame, shape.width)
+                if shape.text_frame.auto_size == MSO_AUTO_SIZE.SHAPE_TO_FIT_TEXT:
+                    # spAutoFit (every helper text box): the box grows to its text,
+                    # so there is no overflow -- only where the grown box lands
+                    bottom = declared = needed
+                ink = _ink(shape.text_frame, left, top,
+                           left + text_width(shape.text_frame, shape.width), needed)
+                if shape.shape_type == MSO_SHAPE_TYPE.TEXT_BOX:
+                    left, top, right, bottom = ink
+                else:                                   # a filled shape inks its whole box
+                    bottom = max(bottom, ink[3])
+        elif getattr(shape, "has_table", False):
+            text = True
+            needed = bottom = max(bottom, top + table_height(shape.table))
+        boxes.append(Box(i, _label(shape), left, top, right, bottom, needed, declared, text))
+    return boxes
+
+
+# ── Spatial index ──────────────────────────────────────────
+def _cells(box):
+    for cx in range(int(box.left // CELL), int(box.right // CELL) + 1):
+        for cy in range(int(box.top // CELL), int(box.bottom // CELL) + 1):
+            yield cx, cy
+
+
+def candidate_pairs(boxes):
+    """Yield each pair of boxes that share at least one grid cell, once."""
+    grid, seen = {}, set()
+    for box in boxes:
+        for cell in _cells(box):
+            members = grid.setdefault(cell, [])
+            for other in members:
+                if (other.index, box.index) not in seen:
+                    seen.add((other.index, box.index))
+                    yield other, box
+            members.append(box)
+
+
+def _contains(a, b):
+    return (a.left <= b.left + TOLERANCE and a.top <= b.top + TOLERANCE and
+            a.right + TOLERANCE >= b.right and a.bottom + TOLERANCE >= b.bottom)
+
+
+def _mostly_inside(text, panel):
+    """A panel (no text) that holds most of a text box is its background, even
+    where the text runs past the panel's edge -- not an overlap."""
+    if panel.text or not text.text:
+        return False
+    w = min(text.right, panel.right) - max(text.left, panel.left)
+    h = min(text.bottom, panel.bottom) - max(text.top, panel.top)
+    area = (text.right - text.left) * (text.bottom - text.top)
+    return w > 0 and h > 0 and w * h * 2 >= area
+
+
+def _overlap(a, b):
+    w = min(a.right, b.right) - max(a.left, b.left)
+    h = min(a.bottom, b.bottom) - max(a.top, b.top)
+    return w > TOLERANCE and h > TOLERANCE
+
+
+# ── Lint ───────────────────────────────────────────────────
+def lint_slide(slide, number, width, height):
+    issues = []
+    boxes = _boxes(slide)
+
+    for box in boxes:
+        if box.needed_bottom > box.declared_bottom + SLACK:
+            extra = Emu(box.needed_bottom - box.declared_bottom).inches
+            issues.append(Issue(number, "overflow", (box.label,),
+                                f"{box.label}: text needs ~{extra:.2f}in more than its box"))
+        if box.left < 0 or box.top < 0 or box.right > width or box.bottom > height:
+            issues.append(Issue(number, "off-canvas", (box.label,),
+                                f"{box.label}: extends past the "
+                                f"{Emu(width).inches:.3g}x{Emu(height).inches:.3g}in canvas"))
+
+    for a, b in candidate_pairs(boxes):
+        # Backgrounds and accent bars sit entirely inside / around their content
+        if not (a.text or b.text) or _contains(a, b) or _contains(b, a):
+            continue
+        if _mostly_inside(a, b) or _mostly_inside(b, a):
+            continue
+        if _overlap(a, b):
+            issues.append(Issue(number, "overlap", (a.label, b.label),
+                                f"{a.label} overlaps {b.label}"))
+    return issues
+
+
+def lint_presentation(prs):
+    """Return a list of Issue tuples for every slide in `prs`."""
+    issues = []
+    for number, slide in enumerate(prs.slides, 1):
+        issues.extend(lint_slide(slide, number, prs.slide_width, prs.slide_height))
+    return issues
+
+
+def main(argv):
+    if not argv:
+        print(__doc__.strip())
+        return 2
+    found = 0
+    for path in argv:
+        issues = lint_presentation(Presentation(path))
+        for issue in issues:
+            print(f"{path}: slide {issue.slide}: [{issue.kind}] {issue.message}")
+        found += len(issues)
+    print(f"[LINT] {found} issue(s) in {len(argv)} deck(s)")
+    return 1 if found else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,266 @@
+"""
+Markdown -> slide specs, for previewing the written architecture docs as slides
+One slide per "## " section (plus continuation slides when a section runs long).
+
+Usage:
+    from md_slides import parse_file
+    specs = parse_file("architecture-slide-deck/09-execution-engine.md")
+
+The mapping is deliberately plain: "# " is the slide title, "## " the
+subtitle, "### " a blue heading, paragraphs and blockquotes text boxes, lists
+bullet lists ("**Label:** text" becomes the bold "Label -- text" prefix),
+pipe tables tables, box-drawing diagrams native diagrams (see
+diagram_layout.parse_ascii) and other fenced blocks small plain text. Blocks
+are stacked top to bottom and spill onto "(cont.)" slides. Inline **bold**,
+*italic*, `code` and [links](url) are kept -- they are rich_text markup too.
+"""
+
+import math
+import os
+import re
+
+from diagram_layout import parse_ascii
+from rich_text import escape, plain_text
+from slide_spec import (BLUE, DARK, GRAY, RIGHT, BulletList, Diagram, Slide, Subtitle, Table,
+                        TextBox, Title)
+
+EMU = 914400                     # per inch
+LEFT, WIDTH = 0.6, 12.0          # content column, inches
+TOP, BOTTOM = 1.6, 6.9           # usable band below the subtitle
+MAX_COLS = 6
+
+_LABEL = re.compile(r"^\*\*([^*]+?):?\*\*:?\s*(.*)$")
+_BULLET = re.compile(r"^(\s*)(?:[-*+]|\d+[.)])\s+(.*)$")
+_SLIDE_PREFIX = re.compile(r"^(?:slide\s+\d+\s*[—-]\s*|\d+(?:\.\d+)*\s*[—-]?\s*)", re.I)
+
+
+def inline(text):
+    """Inline markdown as helper text -- rich_text reads **, *, ` and links as-is."""
+    return text.strip()
+
+
+def _bullet(text):
+    match = _LABEL.match(text.strip())
+    if match and match.group(2):
+        rest = re.sub(r"^[—–-]+\s*", "", match.group(2))
+        return f"{inline(match.group(1))} -- {inline(rest)}"
+    return inline(text)
+
+
+def _cells(line):
+    return [inline(c) for c in line.strip().strip("|").split("|")]
+
+
+# ── Block parser ───────────────────────────────────────────
+def blocks(lines):
+    """Yield (kind, payload) blocks for one section's lines."""
+    i, n = 0, len(lines)
+    while i < n:
+        line = lines[i]
+        stripped = line.strip()
+        if not stripped or stripped == "---":
+            i += 1
+        elif stripped.startswith("```"):
+            j = i + 1
+            while j < n and not lines[j].strip().startswith("```"):
+                j += 1
+            yield "code", [l.rstrip() for l in lines[i + 1:j]]
+            i = j + 1
+        elif stripped.startswith("#"):
+            yield "heading", inline(stripped.lstrip("#"))
+            i += 1
+        elif stripped.startswith("|"):
+            rows = []
+            while i < n and lines[i].strip().startswith("|"):
+                if not re.match(r"^\|[\s:|-]+\|$", lines[i].strip()):
+                    rows.append(_cells(lines[i])[:MAX_COLS])
+                i += 1
+            if rows:
+                yield "table", rows
+        elif stripped.startswith(">"):
+            text = []
+            while i < n and lines[i].strip().startswith(">"):
+                text.append(lines[i].strip().lstrip(">").strip())
+                i += 1
+            yield "quote", inline(" ".join(t for t in text if t))
+        elif _BULLET.match(line):
+            items = []
+            while i < n and (_BULLET.match(lines[i]) or
+                             (lines[i].startswith("  ") and lines[i].strip() and items)):
+                match = _BULLET.match(lines[i])
+                if match:
+                    nested = "  " if len(match.group(1)) >= 2 else ""
+                    items.append(nested + _bullet(match.group(2)))
+                else:
+                    items[-1] += " " + inline(lines[i])
+                i += 1
+            yield "bullets", items
+        else:
+            text = []
+            while i < n and lines[i].strip() and not re.match(r"^\s*(?:[#|>`]|[-*+] |\d+[.)] )", lines[i]):
+                text.append(lines[i].strip())
+                i += 1
+            if not text:        # a stray marker the branches above didn't take
+                text, i = [stripped], i + 1
+            yield "para", inline(" ".join(text))
+
+
+# ── Height estimates (inches) ──────────────────────────────
+def _lines(text, size, width):
+    per_line = max(1, int(width * 72 / (size * 0.47)) - 2)
+    return max(1, math.ceil(len(plain_text(text)) / per_line))
+
+
+def _text_height(text, size, width=WIDTH):
+    return _lines(text, size, width) * size * 1.2 / 72 + 0.12
+
+
+def _row_height(row, cols):
+    width = WIDTH / cols
+    return max(_lines(c, 11, width - 0.2) for c in row) * 11 * 1.2 / 72 + 0.12
+
+
+def _bullet_height(item):
+    return _lines(item, 14, WIDTH - 0.5) * 14 * 1.2 / 72 + 8 / 72
+
+
+# ── Layout ─────────────────────────────────────────────────
+class _Pager:
+    """Stacks elements down the slide, opening "(cont.)" slides as needed."""
+
+    def __init__(self, title, subtitle):
+        self.title, self.subtitle = title, subtitle
+        self.slides = []
+        self.new_page()
+
+    def new_page(self):
+        subtitle = self.subtitle + (" (cont.)" if self.slides else "")
+        self.elements = [Title(self.title[:70])]
+        if subtitle:
+            self.elements.append(Subtitle(subtitle[:120]))
+        self.slides.append(self.elements)
+        self.y = TOP
+
+    @property
+    def room(self):
+        return BOTTOM - self.y
+
+    def fresh(self):
+        return self.y == TOP
+
+    def ensure(self, height):
+        if height > self.room and not self.fresh():
+            self.new_page()
+
+    def add(self, element, height):
+        self.elements.append(element)
+        self.y += height + 0.1
+
+
+def _i(inches):
+    return int(inches * EMU)
+
+
+def layout(title, subtitle, section):
+    """Slide element lists for one section."""
+    page = _Pager(title, subtitle)
+    for kind, payload in section:
+        if kind == "heading":
+            page.ensure(0.8)
+            page.add(TextBox(_i(LEFT), _i(page.y), _i(WIDTH), _i(0.4), payload,
+                             size=16, color=BLUE, bold=True), 0.35)
+        elif kind in ("para", "quote"):
+            height = _text_height(payload, 14)
+            page.ensure(height)
+            page.add(TextBox(_i(LEFT), _i(page.y), _i(WIDTH), _i(height), payload,
+                             size=14, color=GRAY if kind == "quote" else DARK,
+                             italic=kind == "quote"), height)
+        elif kind == "bullets":
+            items = list(payload)
+            while items:
+                page.ensure(_bullet_height(items[0]) + 0.1)
+                fit, height = [], 0.0
+                while items and height + _bullet_height(items[0]) <= page.room:
+                    height += _bullet_height(items[0])
+                    fit.append(items.pop(0))
+                if not fit:                              # one huge item: force it
+                    fit.append(items.pop(0))
+                    height = _bullet_height(fit[0])
+                page.add(BulletList(_i(LEFT), _i(page.y), _i(WIDTH - 0.5), fit,
+                                    size=14, spacing=4), height)
+                if items:
+                    page.new_page()
+        elif kind == "table":
+            header, rows = payload[0], payload[1:]
+            cols = len(header)
+            rows = [(r + [""] * cols)[:cols] for r in rows]
+            while True:
+                page.ensure(_row_height(header, cols) + (_row_height(rows[0], cols) if rows else 0))
+                height, fit = _row_height(header, cols), []
+                while rows and height + _row_height(rows[0], cols) <= page.room:
+                    height += _row_height(rows[0], cols)
+                    fit.append(rows.pop(0))
+                if not fit and rows:
+                    fit.append(rows.pop(0))
+                page.add(Table(_i(LEFT), _i(page.y), _i(WIDTH), _i(0.3), header, fit,
+                               font_size=11), height)
+                if not rows:
+                    break
+                page.new_page()
+        elif kind == "code":
+            lines = [l for l in payload if l.strip()]
+            if not lines:
+                continue
+            graph = parse_ascii("\n".join(payload))
+            if graph:
+                nodes, edges, groups = graph
+                page.ensure(3.0)
+                height = min(page.room, max(2.5, len(lines) * 0.12))
+                page.add(Diagram(_i(LEFT), _i(page.y), _i(WIDTH), _i(height),
+                                 [(nid, escape(label), escape(detail)) for nid, label, detail in nodes],
+                                 edges,
+                                 [(gid, escape(label), *members) for gid, label, members in groups],
+                                 "auto"),
+                         height)
+                continue
+            page.ensure(min(len(lines), 6) * 12 / 72 + 0.1)
+            keep = max(1, int((page.room - 0.1) / (12 / 72)))
+            if len(lines) > keep:
+                lines = lines[:keep - 1] + ["..."]
+            height = len(lines) * 12 / 72 + 0.1
+            page.add(TextBox(_i(LEFT), _i(page.y), _i(WIDTH), _i(height),
+                             "\n".join(map(escape, lines)), size=10, color=DARK), height)
+    return page.slides
+
+
+def parse_text(text, name=""):
+    """Slide specs for one markdown document (numbered from 1 within it)."""
+    title, sections, current = name, [], None
+    for line in text.splitlines():
+        if line.startswith("# ") and title == name:
+            title = _SLIDE_PREFIX.sub("", inline(line[2:])) or name
+        elif line.startswith("## "):
+            current = (_SLIDE_PREFIX.sub("", inline(line[3:])), [])
+            sections.append(current)
+        elif current is not None:
+            current[1].append(line)
+        elif line.strip() and not line.startswith("#"):
+            if not sections or sections[0][0] != "":
+                sections.insert(0, ("", []))
+            sections[0][1].append(line)
+
+    pages = []
+    for subtitle, lines in sections:
+        section = list(blocks(lines))
+        if section:
+            pages.extend(layout(title, subtitle, section))
+    for i, elements in enumerate(pages, 1):
+        # Footer names the source, like slide_num() but stable across edits elsewhere
+        elements.append(TextBox(_i(8.1), _i(7.05), _i(5.0), _i(0.3), f"{name}  {i}/{len(pages)}",
+                                size=10, color=GRAY, align=RIGHT))
+    return [Slide(i, elements) for i, elements in enumerate(pages, 1)]
+
+
+def parse_file(path):
+    with open(path, encoding="utf-8") as f:
+        return parse_text(f.read(), os.path.splitext(os.path.basename(path))[0])
@@ -0,0 +1,431 @@
+"""
+Deck merge -- many generated decks into one
+Streams slides from N source packages into a single output package.
+
+Usage:
+    python merge_pptx.py -o merged.pptx module1.pptx module2.pptx ...
+    python merge_pptx.py -o merged.pptx @decks.txt      (one path per line)
+
+Works on the raw OPC package (zip + XML parts), never on python-pptx objects:
+sources are opened one at a time and every part is written to the output as
+soon as it is seen. Layouts, masters, themes and media are deduplicated by
+content hash, so fifty decks built from the same template still ship one
+master and one copy of each image. Notes slides and comments are dropped.
+"""
+
+import argparse
+import hashlib
+import posixpath
+import re
+import sys
+import zipfile
+from collections import Counter
+
+from lxml import etree
+
+# ── OPC names ──────────────────────────────────────────────
+NS_CT   = "http://schemas.openxmlformats.org/package/2006/content-types"
+NS_RELS = "http://schemas.openxmlformats.org/package/2006/relationships"
+NS_P    = "http://schemas.openxmlformats.org/presentationml/2006/main"
+NS_R    = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+
+RT = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/"
+RT_OFFICE_DOC   = RT + "officeDocument"
+RT_CORE_PROPS   = "http://schemas.openxmlformats.org/package/2006/relationships/metadata/core-properties"
+RT_SLIDE        = RT + "slide"
+RT_LAYOUT       = RT + "slideLayout"
+RT_MASTER       = RT + "slideMaster"
+RT_THEME        = RT + "theme"
+RT_PRES_PROPS   = RT + "presProps"
+RT_VIEW_PROPS   = RT + "viewProps"
+RT_TABLE_STYLES = RT + "tableStyles"
+# Parts that point back into the slide graph or carry per-deck state
+RT_DROPPED = {RT + "notesSlide", RT + "notesMaster", RT + "handoutMaster",
+              RT + "comments", RT + "commentAuthors", RT_SLIDE}
+
+CT_RELS = "application/vnd.openxmlformats-package.relationships+xml"
+CT_PRESENTATION = "application/vnd.openxmlformats-officedocument.presentationml.presentation.main+xml"
+CT_SLIDE = "application/vnd.openxmlformats-officedocument.presentationml.slide+xml"
+
+FIRST_MASTER_ID = 2147483648     # sldMasterId / sldLayoutId values start here
+FIRST_SLIDE_ID = 256
+
+
+def qn(ns, tag):
+    return "{%s}%s" % (ns, tag)
+
+
+def rels_name(partname):
+    """'/ppt/slides/slide1.xml' -> '/ppt/slides/_rels/slide1.xml.rels'"""
+    folder, name = posixpath.split(partname)
+    return posixpath.join(folder, "_rels", name + ".rels")
+
+
+def rels_xml(rels):
+    """Serialize [(rId, type, target, external)] to a .rels blob."""
+    root = etree.Element(qn(NS_RELS, "Relationships"), nsmap={None: NS_RELS})
+    for rid, rtype, target, external in rels:
+        el = etree.SubElement(root, qn(NS_RELS, "Relationship"),
+                              Id=rid, Type=rtype, Target=target)
+        if external:
+            el.set("TargetMode", "External")
+    return etree.tostring(root, xml_declaration=True, encoding="UTF-8", standalone=True)
+
+
+def content_types_xml(defaults, overrides):
+    root = etree.Element(qn(NS_CT, "Types"), nsmap={None: NS_CT})
+    for ext, ct in sorted(defaults.items()):
+        etree.SubElement(root, qn(NS_CT, "Default"), Extension=ext, ContentType=ct)
+    for name, ct in sorted(overrides.items()):
+        etree.SubElement(root, qn(NS_CT, "Override"), PartName=name, ContentType=ct)
+    return etree.tostring(root, xml_declaration=True, encoding="UTF-8", standalone=True)
+
+
+def relative(source, target):
+    return posixpath.relpath(target, posixpath.dirname(source))
+
+
+class Package:
+    """Read-only view of a .pptx zip: part blobs, content types, relationships."""
+
+    def __init__(self, path):
+        self.path = path
+        self.zip = zipfile.ZipFile(path)
+        types = etree.fromstring(self.zip.read("[Content_Types].xml"))
+        self.defaults = {el.get("Extension").lower(): el.get("ContentType")
+                         for el in types.iter(qn(NS_CT, "Default"))}
+        self.overrides = {el.get("PartName"): el.get("ContentType")
+                          for el in types.iter(qn(NS_CT, "Override"))}
+
+    def close(self):
+        self.zip.close()
+
+    def names(self):
+        return ["/" + n for n in self.zip.namelist()]
+
+    def exists(self, partname):
+        try:
+            self.zip.getinfo(partname.lstrip("/"))
+            return True
+        except KeyError:
+            return False
+
+    def read(self, partname):
+        return self.zip.read(partname.lstrip("/"))
+
+    def content_type(self, partname):
+        ext = partname.rsplit(".", 1)[-1].lower()
+        return self.overrides.get(partname) or self.defaults.get(ext, "application/octet-stream")
+
+    def rels(self, partname):
+        """[(rId, type, target, external)] with internal targets made absolute."""
+        name = rels_name(partname) if partname != "/" else "/_rels/.rels"
+        if not self.exists(name):
+            return []
+        base = posixpath.dirname(partname)
+        out = []
+        for el in etree.fromstring(self.read(name)).iter(qn(NS_RELS, "Relationship")):
+            external = el.get("TargetMode") == "External"
+            target = el.get("Target")
+            if not external:
+                target = posixpath.normpath(posixpath.join(base, target))
+            out.append((el.get("Id"), el.get("Type"), target, external))
+        return out
+
+    def main_part(self):
+        return next(t for _, rt, t, _ in self.rels("/") if rt == RT_OFFICE_DOC)
+
+    def slide_parts(self):
+        """Slide partnames in presentation order."""
+        pres = self.main_part()
+        targets = {rid: t for rid, _, t, _ in self.rels(pres)}
+        root = etree.fromstring(self.read(pres))
+        return [targets[el.get(qn(NS_R, "id"))]
+                for el in root.iter(qn(NS_P, "sldId"))]
+
+
+class _Master:
+    """An output slide master; its layout list is filled in as layouts are used."""
+
+    def __init__(self, partname, root, rels):
+        self.partname = partname
+        self.root = root
+        self.rels = rels
+        self.next_rid = 1 + max([int(r[0][3:]) for r in rels if r[0][3:].isdigit()] or [0])
+
+    def add_layout(self, layout_id, layout_name):
+        rid = f"rId{self.next_rid}"
+        self.next_rid += 1
+        self.rels.append((rid, RT_LAYOUT, relative(self.partname, layout_name), False))
+        lst = self.root.find(qn(NS_P, "sldLayoutIdLst"))
+        etree.SubElement(lst, qn(NS_P, "sldLayoutId"),
+                         {"id": str(layout_id), qn(NS_R, "id"): rid})
+
+
+class DeckMerger:
+    """Append decks slide by slide to one output package.
+
+    Only hashes, part names and the (few) master trees are held between
+    sources, so memory stays flat no matter how many decks are merged.
+    """
+
+    def __init__(self, output):
+        self.out = zipfile.ZipFile(output, "w", zipfile.ZIP_DEFLATED)
+        self.by_hash = {}              # content key -> output partname
+        self.counters = {}             # partname stem -> last number used
+        self.defaults = {"rels": CT_RELS, "xml": "application/xml"}
+        self.overrides = {}
+        self.masters = []              # [_Master] in output order
+        self.slides = []               # output slide partnames, in order
+        self.next_id = FIRST_MASTER_ID
+        self.presentation = None       # (xml root, rels) taken from the first deck
+        self.core = None
+        self.deduped = 0
+
+    # ── Writing ──
+    def _write(self, partname, blob, content_type, rels=()):
+        self.out.writestr(partname.lstrip("/"), blob)
+        if rels:
+            self.out.writestr(rels_name(partname).lstrip("/"), rels_xml(rels))
+        ext = partname.rsplit(".", 1)[-1].lower()
+        if ext == "xml":
+            self.overrides[partname] = content_type
+        elif self.defaults.setdefault(ext, content_type) != content_type:
+            self.overrides[partname] = content_type
+
+    def _allocate(self, partname):
+        """'/ppt/media/image7.png' -> next free '/ppt/media/imageN.png'"""
+        folder, name = posixpath.split(partname)
+        stem, ext = posixpath.splitext(name)
+        numbered = re.sub(r"\d+$", "", stem)
+        key = posixpath.join(folder, numbered)
+        if numbered == stem and key not in self.counters:
+            self.counters[key] = 0
+            return partname
+        self.counters[key] = n = self.counters.get(key, 0) + 1
+        return f"{key}{n}{ext}"
+
+    def _key(self, blob, links):
+        h = hashlib.sha1(blob)
+        for rid, target in sorted(links.items()):
+            h.update(f"|{rid}>{target}".encode())
+        return h.hexdigest()
+
+    # ── Part copying ──
+    def _links(self, src, memo, partname, skip=RT_DROPPED, source_rels=None):
+        """Copy targets of `partname`'s rels (or of `source_rels`, shaped like
+        src.rels()); return output rels + {rId: new target}."""
+        rels, links = [], {}
+        for rid, rtype, target, external in src.rels(partname) if source_rels is None else source_rels:
+            if rtype in skip:
+                continue
+            if not external:
+                if rtype == RT_MASTER:
+                    target = self._master(src, memo, target).partname
+                elif rtype == RT_LAYOUT:
+                    target = self._layout(src, memo, target)
+                else:
+                    target = self._part(src, memo, target)
+                links[rid] = target
+            rels.append((rid, rtype, target, external))
+        return rels, links
+
+    def _finish(self, partname, rels):
+        return [(rid, rtype, target if external else relative(partname, target), external)
+                for rid, rtype, target, external in rels]
+
+    def _part(self, src, memo, name):
+        """Copy a leaf-ish part (media, theme, chart ...) once per distinct content."""
+        if name in memo:
+            return memo[name]
+        rels, links = self._links(src, memo, name, RT_DROPPED | {RT_LAYOUT, RT_MASTER})
+        blob = src.read(name)
+        key = self._key(blob, links)
+        if key in self.by_hash:
+            self.deduped += 1
+        else:
+            new = self.by_hash[key] = self._allocate(name)
+            self._write(new, blob, src.content_type(name), self._finish(new, rels))
+        memo[name] = self.by_hash[key]
+        return memo[name]
+
+    def _master(self, src, memo, name):
+        if name in memo:
+            return memo[name]
+        rels, links = self._links(src, memo, name, RT_DROPPED | {RT_LAYOUT})
+        root = etree.fromstring(src.read(name))
+        lst = root.find(qn(NS_P, "sldLayoutIdLst"))
+        if lst is None:
+            lst = etree.SubElement(root, qn(NS_P, "sldLayoutIdLst"))
+        lst.clear()
+        key = self._key(etree.tostring(root), links)
+        if key not in self.by_hash:
+            new = self._allocate(name)
+            self.by_hash[key] = _Master(new, root, self._finish(new, rels))
+            self.masters.append(self.by_hash[key])
+            self.overrides[new] = src.content_type(name)
+        else:
+            self.deduped += 1
+        memo[name] = self.by_hash[key]
+        return memo[name]
+
+    def _layout(self, src, memo, name):
+        if name in memo:
+            return memo[name]
+        master = next(t for _, rt, t, _ in src.rels(name) if rt == RT_MASTER)
+        master = self._master(src, memo, master)
+        rels, links = self._links(src, memo, name)
+        blob = src.read(name)
+        key = self._key(blob, links)
+        if key in self.by_hash:
+            self.deduped += 1
+        else:
+            new = self.by_hash[key] = self._allocate(name)
+            self._write(new, blob, src.content_type(name), self._finish(new, rels))
+            master.add_layout(self.next_id, new)
+            self.next_id += 1
+        memo[name] = self.by_hash[key]
+        return memo[name]
+
+    # ── Public API ──
+    def add_slide(self, src, memo, name, blob=None, rels=None):
+        """Copy one slide of `src`; returns its output partname.
+
+        A slide rendered elsewhere (render_pptx.py) passes its XML as `blob`
+        and its rels as `rels`, with targets resolved against `src` -- the
+        template it was rendered on; `name` is then unused.
+        """
+        if self.presentation is None:
+            self._adopt_presentation(src, memo)
+        rels, _ = self._links(src, memo, name, source_rels=rels)
+        new = self._allocate("/ppt/slides/slide1.xml")
+        if blob is None:
+            blob, content_type = src.read(name), src.content_type(name)
+        else:
+            content_type = CT_SLIDE
+        self._write(new, blob, content_type, self._finish(new, rels))
+        self.slides.append(new)
+        return new
+
+    def add_deck(self, path):
+        src = Package(path)
+        memo = {}                      # source partname -> output partname
+        try:
+            if self.presentation is None:
+                self._adopt_presentation(src, memo)
+            for name in src.slide_parts():
+                self.add_slide(src, memo, name)
+        finally:
+            src.close()
+
+    def _adopt_presentation(self, src, memo):
+        """Keep the first deck's presentation settings (slide size, text styles ...)."""
+        pres = src.main_part()
+        root = etree.fromstring(src.read(pres))
+        keep = {RT_PRES_PROPS, RT_VIEW_PROPS, RT_TABLE_STYLES, RT_THEME}
+        rels = [(rid, rt, self._part(src, memo, t), False)
+                for rid, rt, t, ext in src.rels(pres) if rt in keep and not ext]
+        self.presentation = (root, rels)
+        for _, rt, target, _ in src.rels("/"):
+            if rt == RT_CORE_PROPS:
+                self._write(target, src.read(target), src.content_type(target))
+                self.core = target
+
+    def close(self):
+        root, kept = self.presentation
+        pres = "/ppt/presentation.xml"
+        # presProps / viewProps / theme / tableStyles aren't referenced by rId in
+        # the XML, so every presentation rel is renumbered from one counter
+        rels = [(f"rId{i}", rt, target, ext) for i, (_, rt, target, ext) in enumerate(kept, 1)]
+        # Drop lists that reference parts we didn't carry over
+        for tag in ("notesMasterIdLst", "handoutMasterIdLst", "custShowLst"):
+            for el in root.findall(qn(NS_P, tag)):
+                root.remove(el)
+        master_lst = root.find(qn(NS_P, "sldMasterIdLst"))
+        master_lst.clear()
+        slide_lst = root.find(qn(NS_P, "sldIdLst"))
+        if slide_lst is None:
+            slide_lst = etree.Element(qn(NS_P, "sldIdLst"))
+            master_lst.addnext(slide_lst)
+        slide_lst.clear()
+
+        n = len(rels)
+        for master in self.masters:
+            n += 1
+            rels.append((f"rId{n}", RT_MASTER, master.partname, False))
+            etree.SubElement(master_lst, qn(NS_P, "sldMasterId"),
+                             {"id": str(self.next_id), qn(NS_R, "id"): f"rId{n}"})
+            self.next_id += 1
+            self._write(master.partname,
+                        etree.tostring(master.root, xml_declaration=True,
+                                       encoding="UTF-8", standalone=True),
+                        self.overrides[master.partname], master.rels)
+        for i, slide in enumerate(self.slides):
+            n += 1
+            rels.append((f"rId{n}", RT_SLIDE, slide, False))
+            etree.SubElement(slide_lst, qn(NS_P, "sldId"),
+                             {"id": str(FIRST_SLIDE_ID + i), qn(NS_R, "id"): f"rId{n}"})
+
+        self._write(pres, etree.tostring(root, xml_declaration=True, encoding="UTF-8",
+                                         standalone=True),
+                    CT_PRESENTATION, self._finish(pres, rels))
+        pkg_rels = [("rId1", RT_OFFICE_DOC, "ppt/presentation.xml", False)]
+        if self.core:
+            pkg_rels.append(("rId2", RT_CORE_PROPS, self.core.lstrip("/"), False))
+        self.out.writestr("_rels/.rels", rels_xml(pkg_rels))
+        self.out.writestr("[Content_Types].xml", content_types_xml(self.defaults, self.overrides))
+        self.out.close()
+
+
+def verify(path):
+    """Problems in a written package: duplicate rIds in a .rels part, or
+    internal targets that don't exist. Empty list = sound."""
+    pkg = Package(path)
+    problems = []
+    try:
+        for name in pkg.names():
+            if not name.endswith(".rels"):
+                continue
+            ids = Counter(el.get("Id") for el in etree.fromstring(pkg.read(name)).iter(qn(NS_RELS, "Relationship")))
+            dupes = sorted(i for i, n in ids.items() if n > 1)
+            if dupes:
+                problems.append(f"{name}: duplicate Id {', '.join(dupes)}")
+        for name in ["/"] + [n for n in pkg.names() if not n.endswith(".rels")]:
+            for rid, _, target, external in pkg.rels(name):
+                if not external and not pkg.exists(target):
+                    problems.append(f"{name}: {rid} points at missing {target}")
+    finally:
+        pkg.close()
+    return problems
+
+
+def merge(output, paths):
+    """Merge `paths` (in order) into `output`; returns the DeckMerger for stats."""
+    merger = DeckMerger(output)
+    for path in paths:
+        merger.add_deck(path)
+    merger.close()
+    return merger
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Merge .pptx decks into one.",
+                                     fromfile_prefix_chars="@")
+    parser.add_argument("-o", "--output", required=True)
+    parser.add_argument("decks", nargs="+")
+    args = parser.parse_args(argv)
+
+    merger = merge(args.output, args.decks)
+    problems = verify(args.output)
+    for problem in problems:
+        print(f"[ERROR] {problem}")
+    if problems:
+        return 1
+    print(f"[OK] Merged {len(args.decks)} deck(s), {len(merger.slides)} slides -> {args.output}")
+    print(f"     {merger.deduped} duplicate part(s) shared, "
+          f"{len(merger.masters)} master(s) kept")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,165 @@
+"""
+Package optimizer -- run after save to shrink a .pptx
+Drops parts the slides can't reach, dedupes identical parts, recompresses.
+
+Usage:
+    python optimize_pptx.py deck.pptx [deck2.pptx ...]         (in place)
+    python optimize_pptx.py deck.pptx -o small.pptx
+
+Presentation() ships the default master with all eleven layouts, but the
+generator only uses Blank (slide_layouts[6]). Layouts no slide uses are cut
+from their master's layout list, masters left without layouts are cut from
+the presentation, and then only parts reachable from the package root are
+written. Parts with identical content and identical outgoing relationships
+(images, themes, layouts) are stored once. Slides, notes, masters and the
+presentation part itself are never merged.
+"""
+
+import argparse
+import hashlib
+import os
+import sys
+import zipfile
+
+from lxml import etree
+
+from merge_pptx import (NS_P, NS_R, RT_LAYOUT, RT_MASTER, Package, content_types_xml, qn,
+                        relative, rels_name, rels_xml)
+
+# Part types that must stay distinct even when byte-identical
+KEEP_DISTINCT = ("slide+xml", "notesSlide+xml", "slideMaster+xml", "presentation.main+xml",
+                 "core-properties+xml", "extended-properties+xml")
+
+
+def _prune_list(root, tag, rels, keep):
+    """Remove tag entries (sldLayoutId / sldMasterId) whose rel was dropped."""
+    lst = root.find(qn(NS_P, tag + "Lst"))
+    if lst is None:
+        return
+    kept = {r[0] for r in rels if keep(r)}
+    for el in list(lst):
+        if el.get(qn(NS_R, "id")) not in kept:
+            lst.remove(el)
+
+
+def optimize(path, output=None):
+    """Rewrite `path` (or write `output`); returns (bytes_before, bytes_after, dropped, merged)."""
+    output = output or path
+    before = os.path.getsize(path)
+    src = Package(path)
+    try:
+        pres = src.main_part()
+        slides = src.slide_parts()
+        rels = {}
+
+        def rels_of(name):
+            if name not in rels:
+                rels[name] = src.rels(name)
+            return rels[name]
+
+        # ── Which layouts / masters are actually used ──
+        used_layouts = {t for s in slides for _, rt, t, ext in rels_of(s) if rt == RT_LAYOUT and not ext}
+        used_masters = {t for l in used_layouts for _, rt, t, ext in rels_of(l) if rt == RT_MASTER}
+        masters = {t for _, rt, t, _ in rels_of(pres) if rt == RT_MASTER}
+        if not used_masters:                       # keep one master; a deck needs it
+            used_masters = set(sorted(masters)[:1])
+        xml = {}                                   # parts whose XML we edit
+        for master in masters & used_masters:
+            rels[master] = [r for r in rels_of(master)
+                            if r[1] != RT_LAYOUT or r[2] in used_layouts]
+            xml[master] = etree.fromstring(src.read(master))
+            _prune_list(xml[master], "sldLayoutId", rels[master], lambda r: True)
+        rels[pres] = [r for r in rels_of(pres) if r[1] != RT_MASTER or r[2] in used_masters]
+        xml[pres] = etree.fromstring(src.read(pres))
+        _prune_list(xml[pres], "sldMasterId", rels[pres], lambda r: r[1] == RT_MASTER)
+
+        # ── Reachable parts ──
+        reachable, stack = set(), ["/"]
+        while stack:
+            name = stack.pop()
+            for _, _, target, external in rels_of(name):
+                if not external and target not in reachable and src.exists(target):
+                    reachable.add(target)
+                    stack.append(target)
+
+        # ── Dedupe: same bytes + same outgoing rels (after canonicalization) ──
+        blobs = {name: src.read(name) for name in reachable if name not in xml}
+        canon = {name: name for name in reachable}
+        mergeable = [n for n in sorted(reachable)
+                     if n not in xml and not src.content_type(n).endswith(KEEP_DISTINCT)]
+        changed = True
+        while changed:                             # converges in a couple of rounds
+            changed, seen = False, {}
+            for name in mergeable:
+                h = hashlib.sha1(blobs[name])
+                for rid, rt, target, external in rels_of(name):
+                    h.update(f"|{rid}|{rt}|{target if external else canon.get(target, target)}".encode())
+                first = seen.setdefault(h.hexdigest(), name)
+                if canon[name] != first:
+                    canon[name], changed = first, True
+
+        # A master that now lists the same layout twice keeps one entry
+        for master in masters & used_masters:
+            seen_targets, kept = set(), []
+            for r in rels[master]:
+                target = canon.get(r[2], r[2])
+                if r[1] == RT_LAYOUT and target in seen_targets:
+                    continue
+                seen_targets.add(target)
+                kept.append(r)
+            rels[master] = kept
+            _prune_list(xml[master], "sldLayoutId", kept, lambda r: True)
+
+        # ── Write ──
+        written = sorted(n for n in reachable if canon[n] == n)
+        tmp = output + ".tmp"
+        overrides = {}
+        with zipfile.ZipFile(tmp, "w", zipfile.ZIP_DEFLATED, compresslevel=9) as out:
+            for name in ["/"] + written:
+                part_rels = [(rid, rt, t if ext else relative(name, canon.get(t, t)), ext)
+                             for rid, rt, t, ext in rels_of(name)
+                             if ext or t in canon]
+                if name == "/":
+                    out.writestr("_rels/.rels", rels_xml(part_rels))
+                    continue
+                blob = (etree.tostring(xml[name], xml_declaration=True, encoding="UTF-8",
+                                       standalone=True) if name in xml else blobs[name])
+                out.writestr(name.lstrip("/"), blob)
+                if part_rels:
+                    out.writestr(rels_name(name).lstrip("/"), rels_xml(part_rels))
+                ext = name.rsplit(".", 1)[-1].lower()
+                if name in src.overrides or src.defaults.get(ext) != src.content_type(name):
+                    overrides[name] = src.content_type(name)
+            exts = {n.rsplit(".", 1)[-1].lower() for n in written} | {"rels"}
+            defaults = {e: ct for e, ct in src.defaults.items() if e in exts}
+            out.writestr("[Content_Types].xml", content_types_xml(defaults, overrides))
+        parts = {n for n in src.names() if not n.endswith(".rels")} - {"/[Content_Types].xml"}
+    finally:
+        src.close()
+    os.replace(tmp, output)
+    dropped = len(parts - reachable)
+    merged = len(reachable) - len(written)
+    return before, os.path.getsize(output), dropped, merged
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Strip unused parts from .pptx files.")
+    parser.add_argument("decks", nargs="+")
+    parser.add_argument("-o", "--output", help="output path (single input only)")
+    args = parser.parse_args(argv)
+    if args.output and len(args.decks) > 1:
+        parser.error("-o works with a single input deck")
+
+    total_before = total_after = 0
+    for deck in args.decks:
+        before, after, dropped, merged = optimize(deck, args.output)
+        total_before, total_after = total_before + before, total_after + after
+        print(f"[OK] {args.output or deck}: {before:,} -> {after:,} bytes "
+              f"({before - after:,} saved, {dropped} part(s) dropped, {merged} merged)")
+    if len(args.decks) > 1:
+        print(f"     total {total_before - total_after:,} bytes saved")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
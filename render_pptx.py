@@ -0,0 +1,119 @@
+"""
+Parallel render -- one huge deck from slide specs, on every core
+Workers render slide chunks to standalone slide XML; one merge writes the package.
+
+Usage:
+    python render_pptx.py specs/appendix.spec -o appendix.pptx [--workers 8] [--chunk 50]
+    python render_pptx.py architecture-slide-deck/*.md -o preview.pptx      (via md_slides)
+
+python-pptx builds a deck in a single object graph, so a few thousand slides
+render on one core however many there are. Here the specs (.spec files from
+import_pptx.py, or markdown through md_slides.py, concatenated in order) are
+cut into chunks; each worker renders its chunk with the generate_pptx helpers
+onto a fresh template and sends back every slide's XML and relationships.
+The parent feeds them, in order, to merge_pptx's DeckMerger against the same
+template, which numbers the slide parts, resolves the layout / master /
+theme links once and writes sldIdLst -- the result is one ordinary package.
+Only the layout the slides use is kept, as after optimize_pptx.
+"""
+
+import argparse
+import io
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import slide_spec
+from merge_pptx import DeckMerger, Package, verify
+
+CHUNK = 50                       # slides per worker task
+PARALLEL_FROM = 2                # chunks; a single chunk renders in-process
+
+
+def _render_chunk(blob):
+    """Worker: specs (slide_spec binary) -> [(slide XML, rels)], rels shaped
+    like Package.rels() so DeckMerger can resolve them against the template."""
+    import generate_pptx as g
+
+    deck = g.new_presentation()
+    slide_spec.render(slide_spec.loads(blob), deck)
+    out = []
+    for slide in deck.slides:
+        part = slide.part
+        rels = [(rel.rId, rel.reltype,
+                 rel.target_ref if rel.is_external else str(rel.target_part.partname),
+                 rel.is_external)
+                for rel in part.rels.values()]
+        out.append((part.blob, rels))
+    return out
+
+
+def render_parallel(slides, output, workers=None, chunk=CHUNK):
+    """Render `slides` into `output`; returns the number of slides written."""
+    import generate_pptx as g
+
+    if not slides:
+        g.new_presentation().save(output)
+        return 0
+    template = io.BytesIO()
+    g.new_presentation().save(template)          # the package every worker renders on
+    src = Package(template)
+    merger, memo = DeckMerger(output), {}
+    jobs = [slide_spec.dumps(slides[i:i + chunk]) for i in range(0, len(slides), chunk)]
+
+    def merge(results):                          # chunks arrive in order
+        for rendered in results:
+            for blob, rels in rendered:
+                merger.add_slide(src, memo, None, blob, rels)
+
+    try:
+        if len(jobs) < PARALLEL_FROM or workers == 1:
+            merge(map(_render_chunk, jobs))
+        else:
+            with ProcessPoolExecutor(workers) as executor:
+                merge(executor.map(_render_chunk, jobs))
+        merger.close()
+    finally:
+        src.close()
+    return len(merger.slides)
+
+
+def load_specs(paths):
+    """Slide specs from .spec and .md files, in the order given."""
+    slides = []
+    for path in paths:
+        if path.lower().endswith(".md"):
+            from md_slides import parse_file
+            slides += parse_file(path)
+        else:
+            slides += slide_spec.load(path)
+    return slides
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render slide specs into one deck, in parallel.")
+    parser.add_argument("specs", nargs="+", help=".spec or .md files, concatenated in order")
+    parser.add_argument("-o", "--output", required=True)
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--chunk", type=int, default=CHUNK, help="slides per worker task")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    slides = load_specs(args.specs)
+    loaded = time.perf_counter()
+    count = render_parallel(slides, args.output, args.workers, max(1, args.chunk))
+    done = time.perf_counter()
+    problems = verify(args.output)
+    for problem in problems:
+        print(f"[ERROR] {problem}")
+    if problems:
+        return 1
+    print(f"[OK] Saved: {args.output} ({count} slides, {os.path.getsize(args.output):,} bytes)")
+    print(f"     load {loaded - started:.2f}s, render + merge {done - loaded:.2f}s "
+          f"({args.workers or os.cpu_count()} worker(s), {max(1, args.chunk)} slides/chunk)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
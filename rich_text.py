@@ -0,0 +1,187 @@
+"""
+Inline rich text -- small markup for the text helpers, parsed once per string
+Emphasis, code, colored metrics, links and line breaks inside one text box.
+
+Usage:
+    text_box(slide, ..., "Flakiness **must** stay {red|< 5%} -- see `retry.py`")
+    python rich_text.py "**bold** *italic* `code` {green|>= 98%} [docs](https://x)"
+
+Markup:
+    **bold**   *italic*   `code`   {red|text}   {#C77700|text}   [label](url)
+    A newline is a line break; a backslash before one of \ ` * { } [ ] makes
+    it literal (escape() does that for text that must print as typed).
+
+parse() turns a string into a tuple of Run(text, flags, color, url) and keeps
+the result in an LRU cache, so a label repeated on thousands of slides is
+parsed once. Text without markup comes back as a single plain run, and the
+helpers then write it exactly as before (one paragraph text, no extra runs).
+"""
+
+import re
+import sys
+from collections import namedtuple
+from functools import lru_cache
+
+BOLD, ITALIC, CODE, BREAK = 1, 2, 4, 8
+CODE_FONT = "Consolas"
+CACHE_SIZE = 65536
+COLORS = {
+    "red":   0xC00000,
+    "green": 0x2E7D32,
+    "amber": 0xC77700,
+    "blue":  0x1F4E79,
+    "gray":  0x666666,
+    "dark":  0x222222,
+}
+
+Run = namedtuple("Run", "text flags color url")
+
+_TOKEN = re.compile(r"""
+      \\(?P<esc>[\\`*{}\[\]])
+    | `(?P<code>[^`]+)`
+    | \*\*(?=\S)(?P<bold>.+?)(?<=\S)\*\*
+    | \*(?=\S)(?P<italic>(?:\*\*.+?\*\*|[^*])+?)(?<=\S)\*
+    | \{(?P<color>\#[0-9A-Fa-f]{6}|[a-z]+)\|(?P<colored>.+?)\}
+    | \[(?P<label>[^\]]+)\]\((?P<url>[^)\s]+)\)
+    | (?P<br>\n)
+""", re.VERBOSE | re.DOTALL)
+_SPECIAL = re.compile(r"[\\`*{}\[\]\n]")
+_ESCAPE = re.compile(r"([\\`*{}\[\]])")
+
+
+# ══════════════════════════════════════════════════════════════
+# PARSE -- string -> (Run, ...)
+# ══════════════════════════════════════════════════════════════
+def _color(name):
+    if name.startswith("#"):
+        return int(name[1:], 16)
+    return COLORS.get(name)
+
+
+def _scan(text, flags, color, url, out):
+    pos = 0
+    for m in _TOKEN.finditer(text):
+        if m.start() > pos:
+            out.append(Run(text[pos:m.start()], flags, color, url))
+        pos = m.end()
+        if m.group("esc") is not None:
+            out.append(Run(m.group("esc"), flags, color, url))
+        elif m.group("code") is not None:
+            out.append(Run(m.group("code"), flags | CODE, color, url))
+        elif m.group("bold") is not None:
+            _scan(m.group("bold"), flags | BOLD, color, url, out)
+        elif m.group("italic") is not None:
+            _scan(m.group("italic"), flags | ITALIC, color, url, out)
+        elif m.group("colored") is not None:
+            rgb = _color(m.group("color"))
+            if rgb is None:                     # {unknown|...} prints as typed
+                out.append(Run("{" + m.group("color") + "|", flags, color, url))
+                _scan(m.group("colored"), flags, color, url, out)
+                out.append(Run("}", flags, color, url))
+            else:
+                _scan(m.group("colored"), flags, rgb, url, out)
+        elif m.group("url") is not None:
+            _scan(m.group("label"), flags, color, m.group("url"), out)
+        else:
+            out.append(Run("", BREAK, None, None))
+    if pos < len(text):
+        out.append(Run(text[pos:], flags, color, url))
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse(text):
+    """Run specs for `text`, adjacent runs with the same style merged."""
+    if not _SPECIAL.search(text):
+        return (Run(text, 0, None, None),)
+    runs = []
+    _scan(text, 0, None, None, runs)
+    merged = []
+    for run in runs:
+        if (merged and not run.flags & BREAK and not merged[-1].flags & BREAK
+                and merged[-1][1:] == run[1:]):
+            merged[-1] = run._replace(text=merged[-1].text + run.text)
+        elif run.text or run.flags & BREAK:
+            merged.append(run)
+    return tuple(merged) or (Run("", 0, None, None),)
+
+
+def is_plain(runs):
+    """True when the runs carry no styling (line breaks allowed)."""
+    return all(r.color is None and r.url is None and r.flags & ~BREAK == 0 for r in runs)
+
+
+def plain_text(text):
+    """`text` with the markup removed -- what the slide will show."""
+    return "".join("\n" if r.flags & BREAK else r.text for r in parse(text))
+
+
+def escape(text):
+    """Backslash the markup characters so `text` renders literally."""
+    return _ESCAPE.sub(r"\\\1", text)
+
+
+# ══════════════════════════════════════════════════════════════
+# WRITE -- run specs onto python-pptx paragraphs
+# ══════════════════════════════════════════════════════════════
+def _style(run, spec, size, color, bold, italic, font):
+    from pptx.dml.color import RGBColor         # parse() stays usable without python-pptx
+    from pptx.util import Pt
+
+    f = run.font
+    if size is not None:
+        f.size = Pt(size)
+    if spec.color is not None:
+        f.color.rgb = RGBColor.from_string(f"{spec.color:06X}")
+    elif color is not None:
+        f.color.rgb = color
+    if bold or spec.flags & BOLD:
+        f.bold = True
+    if italic or spec.flags & ITALIC:
+        f.italic = True
+    if spec.flags & CODE:
+        f.name = CODE_FONT
+    elif font is not None:
+        f.name = font
+    if spec.url:
+        run.hyperlink.address = spec.url
+
+
+def add_runs(paragraph, text, size=None, color=None, bold=False, italic=False, font=None):
+    """Append `text` as runs, each fully styled (size / color / font set on the run)."""
+    for spec in parse(text):
+        if spec.flags & BREAK:
+            paragraph.add_line_break()
+            continue
+        r = paragraph.add_run()
+        r.text = spec.text
+        _style(r, spec, size, color, bold, italic, font)
+
+
+def write(paragraph, text):
+    """Set a paragraph's text. The caller styles the paragraph (p.font) as
+    usual; markup runs only override what they change."""
+    runs = parse(text)
+    if is_plain(runs):
+        paragraph.text = "".join("\n" if r.flags & BREAK else r.text for r in runs)
+        return
+    for r in paragraph.runs:
+        paragraph._p.remove(r._r)
+    add_runs(paragraph, text)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        print(__doc__.strip())
+        return 2
+    for text in argv:
+        for r in parse(text.replace("\\n", "\n")):
+            style = "+".join(n for n, bit in (("bold", BOLD), ("italic", ITALIC), ("code", CODE),
+                                              ("br", BREAK)) if r.flags & bit) or "plain"
+            extra = (f" #{r.color:06X}" if r.color is not None else "") + (f" -> {r.url}" if r.url else "")
+            print(f"{style:<18}{extra:<10} {r.text!r}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,299 @@
+"""
+Deck search -- full-text index over generated .pptx files
+Find every deck, slide and shape that says "Flakiness %" without opening a deck.
+
+Usage:
+    python search_pptx.py update decks/ [more decks or folders]     (incremental)
+    python search_pptx.py query "Flakiness %" [-n 50] [-l]
+    python search_pptx.py stats
+
+The index is one SQLite file (deck-index.sqlite, or --index PATH) holding an
+FTS5 inverted index. Each text-box paragraph, bullet and table cell is one
+entry, with its deck, slide number, shape id/name and where it sits in the
+shape: "p3" (third paragraph) or "r2c4" (table row 2, column 4).
+
+update only re-reads decks whose size or mtime changed, and drops decks that
+have gone from the folders it scans. Slide XML is read straight from the zip
+with lxml, in parallel for big batches. A query looks up the words in the
+index and then checks the exact text (case-insensitive) against the stored
+entry, so "self-heal" matches "Self-healing locators" but "85%" won't match
+"85 %".
+"""
+
+import argparse
+import os
+import re
+import sqlite3
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from lxml import etree
+
+from merge_pptx import NS_P, Package, qn
+
+NS_A = "http://schemas.openxmlformats.org/drawingml/2006/main"
+DEFAULT_INDEX = "deck-index.sqlite"
+SCHEMA_VERSION = 1
+DECK_SHIFT = 20                  # entry rowid = deck id << 20 | entry number
+BATCH = 500                      # decks per transaction
+PARALLEL_FROM = 16               # smaller batches are read in-process
+
+_SP, _FRAME = qn(NS_P, "sp"), qn(NS_P, "graphicFrame")
+_CNVPR = qn(NS_P, "cNvPr")
+_P, _T, _BR = qn(NS_A, "p"), qn(NS_A, "t"), qn(NS_A, "br")
+_TR, _TC = qn(NS_A, "tr"), qn(NS_A, "tc")
+
+
+# ══════════════════════════════════════════════════════════════
+# EXTRACT -- (slide, shape id, shape name, location, text) per entry
+# ══════════════════════════════════════════════════════════════
+def _paragraph_text(p):
+    return "".join(el.text or "" if el.tag == _T else "\n"
+                   for el in p.iter(_T, _BR)).strip()
+
+
+def slide_entries(xml):
+    """Entries of one slide's XML: text-box paragraphs and table cells."""
+    root = etree.fromstring(xml)
+    for shape in root.iter(_SP, _FRAME):
+        props = next(shape.iter(_CNVPR), None)
+        if props is None:
+            continue
+        shape_id, name = int(props.get("id", 0)), props.get("name", "")
+        if shape.tag == _SP:
+            for i, p in enumerate(shape.iter(_P), 1):
+                text = _paragraph_text(p)
+                if text:
+                    yield shape_id, name, f"p{i}", text
+        else:
+            for r, row in enumerate(shape.iter(_TR), 1):
+                for c, cell in enumerate(row.iter(_TC), 1):
+                    text = " ".join(t for t in map(_paragraph_text, cell.iter(_P)) if t)
+                    if text:
+                        yield shape_id, name, f"r{r}c{c}", text
+
+
+def extract(path):
+    """(path, [(slide, shape_id, shape_name, loc, text)]) -- runs in workers."""
+    pkg = Package(path)
+    try:
+        entries = [(number,) + entry
+                   for number, part in enumerate(pkg.slide_parts(), 1)
+                   for entry in slide_entries(pkg.read(part))]
+    finally:
+        pkg.close()
+    return path, entries
+
+
+def _extract_safe(path):
+    try:
+        return extract(path)
+    except Exception as e:                    # a broken deck must not stop the batch
+        return path, e
+
+
+# ══════════════════════════════════════════════════════════════
+# INDEX
+# ══════════════════════════════════════════════════════════════
+class SearchIndex:
+    def __init__(self, path=DEFAULT_INDEX):
+        self.path = path
+        self.db = sqlite3.connect(path, isolation_level=None)   # transactions are explicit
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        if self.db.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            self.db.executescript(f"""
+                DROP TABLE IF EXISTS decks;
+                DROP TABLE IF EXISTS entries;
+                CREATE TABLE decks (id INTEGER PRIMARY KEY, path TEXT UNIQUE NOT NULL,
+                                    mtime_ns INTEGER, size INTEGER, slides INTEGER);
+                CREATE VIRTUAL TABLE entries USING fts5(
+                    text, slide UNINDEXED, shape_id UNINDEXED, shape UNINDEXED, loc UNINDEXED,
+                    tokenize = "unicode61 remove_diacritics 2");
+                PRAGMA user_version = {SCHEMA_VERSION};
+            """)
+
+    def close(self):
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ── Writing ──
+    def _deck_id(self, path):
+        row = self.db.execute("SELECT id FROM decks WHERE path = ?", (path,)).fetchone()
+        if row:
+            return row[0]
+        return self.db.execute("INSERT INTO decks (path) VALUES (?)", (path,)).lastrowid
+
+    def _clear(self, deck_id):
+        self.db.execute("DELETE FROM entries WHERE rowid BETWEEN ? AND ?",
+                        (deck_id << DECK_SHIFT, ((deck_id + 1) << DECK_SHIFT) - 1))
+
+    def add(self, path, entries):
+        """(Re)index one deck from extract() output."""
+        path = os.path.abspath(path)
+        st = os.stat(path)
+        deck_id = self._deck_id(path)
+        self._clear(deck_id)
+        base = deck_id << DECK_SHIFT
+        self.db.executemany(
+            "INSERT INTO entries (rowid, slide, shape_id, shape, loc, text) VALUES (?, ?, ?, ?, ?, ?)",
+            ((base + i, *entry) for i, entry in enumerate(entries[:(1 << DECK_SHIFT) - 1])))
+        self.db.execute("UPDATE decks SET mtime_ns = ?, size = ?, slides = ? WHERE id = ?",
+                        (st.st_mtime_ns, st.st_size, max((e[0] for e in entries), default=0),
+                         deck_id))
+
+    def remove(self, path):
+        row = self.db.execute("SELECT id FROM decks WHERE path = ?", (path,)).fetchone()
+        if row:
+            self._clear(row[0])
+            self.db.execute("DELETE FROM decks WHERE id = ?", row)
+
+    def update(self, roots, workers=None):
+        """Index new and changed decks under `roots` (files or folders) and
+        forget vanished ones. Returns (indexed, unchanged, removed, errors)."""
+        found, scanned_dirs, files = [], [], set()
+        for root in roots:
+            root = os.path.abspath(root)
+            if os.path.isdir(root):
+                scanned_dirs.append(root)
+                for folder, _, names in os.walk(root):
+                    found += [os.path.join(folder, f) for f in names
+                              if f.lower().endswith(".pptx") and not f.startswith("~$")]
+            else:
+                files.add(root)
+                if os.path.exists(root):
+                    found.append(root)
+
+        known = {path: (mtime, size) for path, mtime, size in
+                 self.db.execute("SELECT path, mtime_ns, size FROM decks")}
+        stale = []
+        for path in found:
+            st = os.stat(path)
+            if known.get(path) != (st.st_mtime_ns, st.st_size):
+                stale.append(path)
+        on_disk = set(found)
+        gone = [p for p in known if p not in on_disk and
+                (p in files or any(p.startswith(d + os.sep) for d in scanned_dirs))]
+
+        errors = []
+        self._write(((path, None) for path in gone), errors)
+        if len(stale) < PARALLEL_FROM:
+            self._write(map(_extract_safe, stale), errors)
+        else:
+            with ProcessPoolExecutor(workers) as executor:
+                self._write(executor.map(_extract_safe, stale, chunksize=8), errors)
+        return len(stale) - len(errors), len(found) - len(stale), len(gone), errors
+
+    def _write(self, results, errors):
+        """Apply (path, entries) results -- entries None removes the deck."""
+        pending = 0
+        self.db.execute("BEGIN")
+        try:
+            for path, entries in results:
+                if entries is None:
+                    self.remove(path)
+                    continue
+                if isinstance(entries, Exception):
+                    errors.append((path, entries))
+                    continue
+                self.add(path, entries)
+                pending += 1
+                if pending >= BATCH:
+                    self.db.execute("COMMIT")
+                    self.db.execute("BEGIN")
+                    pending = 0
+            self.db.execute("COMMIT")
+        except BaseException:
+            self.db.execute("ROLLBACK")
+            raise
+
+    # ── Reading ──
+    def query(self, text, limit=50):
+        """[(deck, slide, shape_id, shape, loc, text)] in deck/slide order."""
+        words = re.findall(r"\w+", text.lower())
+        if not words:
+            return []
+        needle = " ".join(text.lower().split())
+        match = '"' + " ".join(words) + '"*'       # phrase, last word as a prefix
+        hits = []
+        rows = self.db.execute(
+            "SELECT d.path, e.slide, e.shape_id, e.shape, e.loc, e.text FROM entries e "
+            "JOIN decks d ON d.id = (e.rowid >> ?) WHERE entries MATCH ? ORDER BY e.rowid",
+            (DECK_SHIFT, match))
+        for row in rows:
+            if needle in " ".join(row[5].lower().split()):
+                hits.append(row)
+                if limit and len(hits) >= limit:
+                    break
+        return hits
+
+    def stats(self):
+        decks, slides = self.db.execute("SELECT COUNT(*), COALESCE(SUM(slides), 0) FROM decks").fetchone()
+        entries = self.db.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        return decks, slides, entries
+
+
+def _show(path):
+    try:
+        rel = os.path.relpath(path)
+    except ValueError:                       # another drive on Windows
+        return path
+    return path if rel.startswith("..") else rel
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Full-text search over .pptx decks.")
+    parser.add_argument("--index", default=DEFAULT_INDEX, help="index file")
+    sub = parser.add_subparsers(dest="command", required=True)
+    up = sub.add_parser("update", help="index new / changed decks, drop deleted ones")
+    up.add_argument("paths", nargs="+", help=".pptx files or folders")
+    up.add_argument("--workers", type=int, default=None)
+    q = sub.add_parser("query", help="find text")
+    q.add_argument("text")
+    q.add_argument("-n", "--limit", type=int, default=50, help="max hits (0 = all)")
+    q.add_argument("-l", "--decks-only", action="store_true", help="list matching decks only")
+    sub.add_parser("stats", help="index size")
+    args = parser.parse_args(argv)
+
+    with SearchIndex(args.index) as index:
+        if args.command == "update":
+            started = time.perf_counter()
+            indexed, unchanged, removed, errors = index.update(args.paths, args.workers)
+            for path, error in errors:
+                print(f"[SKIP] {_show(path)}: {error}")
+            print(f"[OK] {args.index}: {indexed} indexed, {unchanged} unchanged, "
+                  f"{removed} removed ({time.perf_counter() - started:.1f}s)")
+        elif args.command == "stats":
+            decks, slides, entries = index.stats()
+            print(f"{args.index}: {decks:,} decks, {slides:,} slides, {entries:,} text entries")
+        else:
+            started = time.perf_counter()
+            hits = index.query(args.text, 0 if args.decks_only else args.limit)
+            elapsed = (time.perf_counter() - started) * 1000
+            if args.decks_only:
+                decks = list(dict.fromkeys(h[0] for h in hits))
+                for deck in decks[:args.limit or None]:
+                    print(_show(deck))
+                print(f"{len(decks)} deck(s) ({elapsed:.1f} ms)")
+            else:
+                deck = None
+                for path, slide, shape_id, shape, loc, text in hits:
+                    if path != deck:
+                        deck = path
+                        print(_show(path))
+                    text = text.replace("\n", " ")
+                    print(f"    slide {slide:<3} {shape} [{loc}]  {text[:100]}")
+                print(f"{len(hits)} hit(s){' (limit reached)' if len(hits) == args.limit else ''} "
+                      f"({elapsed:.1f} ms)")
+            return 0 if hits else 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,427 @@
+"""
+Slide specs -- compact, typed descriptions of what the generate_pptx helpers draw
+One class per helper, fixed __slots__, and a compact, validated binary format.
+
+Usage:
+    from slide_spec import Slide, Title, Table, dump, load, render
+    python slide_spec.py --bench 20000          (memory / load-time benchmark)
+
+Coordinates are EMU ints, colors 0xRRGGBB ints, font sizes points. Strings in
+tables and bullet lists are interned, and the binary format stores every
+distinct string once, so a few hundred thousand table cells that say
+">= 85%" cost one string object. Loaded specs take well under half the
+memory of the equivalent JSON dicts; loading is on par with unpickling the
+same objects (--bench prints both), without pickle's code execution.
+
+Binary layout (little-endian):
+    b"SPEC" version:u8 n_string_bytes:u32 n_ints:u32
+    strings  -- UTF-8, NUL-separated (dumps() rejects strings containing NUL)
+    ints     -- int32 stream: per slide [number, n_elements], per element
+                [kind, fields...]; strings are indexes into the string table,
+                lists are a count followed by their items
+"""
+
+import json
+import pickle
+import struct
+import sys
+import time
+import tracemalloc
+from array import array
+
+MAGIC = b"SPEC"
+VERSION = 1
+_HEADER = struct.Struct("<4sBII")
+NO_COLOR = -1
+
+# Colors and alignments as stored in specs
+BLUE, DARK, BLACK, GRAY, WHITE = 0x1F4E79, 0x222222, 0x333333, 0x666666, 0xFFFFFF
+LIGHT_GRAY, PANEL = 0xE8E8E8, 0xF7F9FC
+LEFT, CENTER, RIGHT = 0, 1, 2
+
+
+def _intern_all(items):
+    return tuple(sys.intern(str(i)) for i in items)
+
+
+class Element:
+    """Base for spec elements. Field order is __slots__ order; `codes` gives
+    each field's wire type: i = int, b = bool (an int on the wire), s = string,
+    S = string list, T = rows."""
+
+    __slots__ = ()
+    kind = 0
+    codes = ""
+
+    def fields(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self.fields() == other.fields()
+
+    def __repr__(self):
+        args = ", ".join(f"{n}={getattr(self, n)!r}" for n in self.__slots__)
+        return f"{type(self).__name__}({args})"
+
+    def __reduce__(self):
+        return type(self), self.fields()
+
+    def to_dict(self):
+        d = {"kind": type(self).__name__}
+        for code, name in zip(self.codes, self.__slots__):
+            value = getattr(self, name)
+            d[name] = [list(r) for r in value] if code == "T" else \
+                list(value) if isinstance(value, tuple) else value
+        return d
+
+
+class Title(Element):
+    __slots__ = ("text", "top")
+    kind, codes = 1, "si"
+
+    def __init__(self, text, top=274320):            # Inches(0.3)
+        self.text, self.top = text, top
+
+
+class Subtitle(Element):
+    __slots__ = ("text", "top")
+    kind, codes = 2, "si"
+
+    def __init__(self, text, top=960120):            # Inches(1.05)
+        self.text, self.top = text, top
+
+
+class TextBox(Element):
+    __slots__ = ("left", "top", "width", "height", "text", "size", "color",
+                 "bold", "align", "italic")
+    kind, codes = 3, "iiiisiibib"
+
+    def __init__(self, left, top, width, height, text, size=16, color=BLACK,
+                 bold=False, align=LEFT, italic=False):
+        self.left, self.top, self.width, self.height = left, top, width, height
+        self.text, self.size, self.color = text, size, color
+        self.bold, self.align, self.italic = bool(bold), align, bool(italic)
+
+
+class BulletList(Element):
+    __slots__ = ("left", "top", "width", "items", "size", "color", "spacing")
+    kind, codes = 4, "iiiSiii"
+
+    def __init__(self, left, top, width, items, size=15, color=BLACK, spacing=4):
+        self.left, self.top, self.width = left, top, width
+        self.items = _intern_all(items)
+        self.size, self.color, self.spacing = size, color, spacing
+
+
+class Table(Element):
+    __slots__ = ("left", "top", "width", "row_height", "headers", "rows", "font_size")
+    kind, codes = 5, "iiiiSTi"
+
+    def __init__(self, left, top, width, row_height, headers, rows, font_size=12):
+        self.left, self.top, self.width, self.row_height = left, top, width, row_height
+        self.headers = _intern_all(headers)
+        self.rows = tuple(_intern_all(row) for row in rows)
+        self.font_size = font_size
+
+
+class SectionBox(Element):
+    __slots__ = ("left", "top", "width", "height", "title", "items", "title_size")
+    kind, codes = 6, "iiiisSi"
+
+    def __init__(self, left, top, width, height, title, items, title_size=16):
+        self.left, self.top, self.width, self.height = left, top, width, height
+        self.title = title
+        self.items = _intern_all(items)
+        self.title_size = title_size
+
+
+class Shape(Element):
+    """Plain rectangle; `line` NO_COLOR means no outline (accent bars, dividers),
+    `fill` NO_COLOR no fill (frames)."""
+    __slots__ = ("left", "top", "width", "height", "fill", "line")
+    kind, codes = 7, "iiiiii"
+
+    def __init__(self, left, top, width, height, fill=PANEL, line=LIGHT_GRAY):
+        self.left, self.top, self.width, self.height = left, top, width, height
+        self.fill, self.line = fill, line
+
+
+class Diagram(Element):
+    """Box-and-arrow diagram: nodes are [id, label, detail] rows, edges [from, to]
+    rows, groups [id, label, member ids...] rows; laid out at render time."""
+    __slots__ = ("left", "top", "width", "height", "nodes", "edges", "groups", "direction")
+    kind, codes = 8, "iiiiTTTs"
+
+    def __init__(self, left, top, width, height, nodes, edges, groups=(), direction="TB"):
+        self.left, self.top, self.width, self.height = left, top, width, height
+        self.nodes = tuple(_intern_all(n) for n in nodes)
+        self.edges = tuple(_intern_all(e) for e in edges)
+        self.groups = tuple(_intern_all(g) for g in groups)
+        self.direction = direction
+
+
+KINDS = {cls.kind: cls for cls in (Title, Subtitle, TextBox, BulletList, Table, SectionBox, Shape,
+                                   Diagram)}
+BY_NAME = {cls.__name__: cls for cls in KINDS.values()}
+
+
+class Slide:
+    __slots__ = ("number", "elements")
+
+    def __init__(self, number, elements=()):
+        self.number = number
+        self.elements = list(elements)
+
+    def __eq__(self, other):
+        return (type(other) is Slide and self.number == other.number
+                and self.elements == other.elements)
+
+    def __repr__(self):
+        return f"Slide({self.number}, {len(self.elements)} elements)"
+
+    def __reduce__(self):
+        return Slide, (self.number, self.elements)
+
+    def to_dict(self):
+        return {"number": self.number, "elements": [e.to_dict() for e in self.elements]}
+
+    @classmethod
+    def from_dict(cls, d):
+        elements = []
+        for e in d["elements"]:
+            e = dict(e)
+            elements.append(BY_NAME[e.pop("kind")](**e))
+        return cls(d["number"], elements)
+
+
+# ══════════════════════════════════════════════════════════════
+# BINARY FORMAT
+# ══════════════════════════════════════════════════════════════
+def dumps(slides):
+    strings, index, ints = [], {}, array("i")
+
+    def sid(text):
+        i = index.get(text)
+        if i is None:
+            if "\0" in text:                   # NUL separates the string table
+                raise ValueError(f"spec strings can't contain NUL: {text[:40]!r}")
+            i = index[text] = len(strings)
+            strings.append(text)
+        return i
+
+    for slide in slides:
+        ints.extend((slide.number, len(slide.elements)))
+        for el in slide.elements:
+            ints.append(el.kind)
+            for code, name in zip(el.codes, el.__slots__):
+                value = getattr(el, name)
+                if code in "ib":
+                    ints.append(int(value))
+                elif code == "s":
+                    ints.append(sid(value))
+                elif code == "S":
+                    ints.append(len(value))
+                    ints.extend(sid(v) for v in value)
+                else:
+                    ints.append(len(value))
+                    for row in value:
+                        ints.append(len(row))
+                        ints.extend(sid(v) for v in row)
+
+    blob = "\0".join(strings).encode("utf-8")
+    if sys.byteorder != "little":
+        ints.byteswap()
+    return _HEADER.pack(MAGIC, VERSION, len(blob), len(ints)) + blob + ints.tobytes()
+
+
+def _read(cls, nxt, strings):
+    """One element of `cls`, its fields read in wire-code order."""
+    el = cls.__new__(cls)
+    for code, name in zip(cls.codes, cls.__slots__):
+        if code == "i":
+            value = nxt()
+        elif code == "b":
+            value = nxt() != 0
+        elif code == "s":
+            value = strings[nxt()]
+        elif code == "S":
+            value = tuple([strings[nxt()] for _ in range(nxt())])
+        else:
+            value = tuple([tuple([strings[nxt()] for _ in range(nxt())]) for _ in range(nxt())])
+        setattr(el, name, value)
+    return el
+
+
+def loads(data):
+    if len(data) < _HEADER.size:
+        raise ValueError("not a slide-spec file (too short for the header)")
+    magic, version, n_bytes, n_ints = _HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("not a slide-spec file (or an unsupported version)")
+    start = _HEADER.size
+    if len(data) != start + n_bytes + 4 * n_ints:
+        raise ValueError(f"slide-spec data is {len(data)} bytes, the header says "
+                         f"{start + n_bytes + 4 * n_ints} (truncated or corrupt)")
+    strings = [sys.intern(s) for s in data[start:start + n_bytes].decode("utf-8").split("\0")]
+    ints = array("i")
+    ints.frombytes(data[start + n_bytes:])
+    if sys.byteorder != "little":
+        ints.byteswap()
+
+    it = iter(ints.tolist())
+    nxt = it.__next__
+    try:
+        return [Slide(number, [_read(KINDS[nxt()], nxt, strings) for _ in range(nxt())])
+                for number in it]
+    except (StopIteration, KeyError, IndexError):
+        raise ValueError("slide-spec data is corrupt (element stream doesn't "
+                         "match its kinds and counts)") from None
+
+
+def dump(slides, path):
+    with open(path, "wb") as f:
+        f.write(dumps(slides))
+
+
+def load(path):
+    with open(path, "rb") as f:
+        return loads(f.read())
+
+
+# ══════════════════════════════════════════════════════════════
+# RENDER -- specs -> python-pptx, through the generate_pptx helpers
+# ══════════════════════════════════════════════════════════════
+def render_slide(spec, deck=None):
+    import generate_pptx as g
+    from pptx.dml.color import RGBColor
+    from pptx.enum.shapes import MSO_SHAPE
+    from pptx.enum.text import PP_ALIGN
+    from pptx.util import Emu, Pt
+
+    def rgb(value):
+        return RGBColor.from_string(f"{value:06X}")
+
+    align = (PP_ALIGN.LEFT, PP_ALIGN.CENTER, PP_ALIGN.RIGHT)
+    s = g.new_slide(deck)
+    for el in spec.elements:
+        if type(el) is Title:
+            g.add_title(s, el.text, top=el.top)
+        elif type(el) is Subtitle:
+            g.add_subtitle(s, el.text, top=el.top)
+        elif type(el) is TextBox:
+            g.text_box(s, el.left, el.top, el.width, el.height, el.text, size=el.size,
+                       color=rgb(el.color), bold=el.bold, align=align[el.align],
+                       italic=el.italic)
+        elif type(el) is BulletList:
+            g.bullet_list(s, el.left, el.top, el.width, list(el.items), size=el.size,
+                          color=rgb(el.color), spacing=el.spacing)
+        elif type(el) is Table:
+            g.add_table(s, el.left, el.top, el.width, Emu(el.row_height).inches,
+                        list(el.headers), [list(r) for r in el.rows], font_size=el.font_size)
+        elif type(el) is SectionBox:
+            g.section_box(s, el.left, el.top, el.width, el.height, el.title,
+                          list(el.items), title_size=el.title_size)
+        elif type(el) is Diagram:
+            g.diagram(s, el.left, el.top, el.width, el.height, el.nodes, el.edges,
+                      [(grp[0], grp[1], grp[2:]) for grp in el.groups], el.direction)
+        elif type(el) is Shape:
+            shape = s.shapes.add_shape(MSO_SHAPE.RECTANGLE, el.left, el.top, el.width, el.height)
+            if el.fill == NO_COLOR:
+                shape.fill.background()
+            else:
+                shape.fill.solid()
+                shape.fill.fore_color.rgb = rgb(el.fill)
+            if el.line == NO_COLOR:
+                shape.line.fill.background()
+            else:
+                shape.line.color.rgb = rgb(el.line)
+                shape.line.width = Pt(1)
+    return s
+
+
+def render(slides, deck=None):
+    for spec in slides:
+        render_slide(spec, deck)
+
+
+# ══════════════════════════════════════════════════════════════
+# BENCHMARK
+# ══════════════════════════════════════════════════════════════
+def _sample_slides(n_elements):
+    """Realistic mix: tables and section boxes like slides 5-9 of the deck."""
+    inch = 914400
+    metrics = ["Ingestion Success Rate", "Parsing Error Rate", "Flakiness %", "Pass Rate"]
+    slides, made = [], 0
+    while made < n_elements:
+        i = len(slides) + 1
+        elements = [
+            Title(f"Module {i}: Generated Slide"),
+            Subtitle("Running tests at scale, reliably, across environments"),
+            SectionBox(int(0.6 * inch), int(1.6 * inch), int(3.7 * inch), int(2.5 * inch),
+                       "Retry Policy", ["Element not found: retry 2x, extend wait",
+                                        "Network timeout: retry 3x, exp. backoff",
+                                        f"Browser crash: restart browser, retry {i % 3}x"]),
+            BulletList(int(0.6 * inch), int(4.9 * inch), int(11 * inch),
+                       ["Each agent fails independently -- no single point of failure",
+                        "Agents can scale independently"], size=14),
+            Table(int(0.6 * inch), int(4.5 * inch), int(12 * inch), int(0.4 * inch),
+                  ["Metric", "Target", "Alert", "Current"],
+                  [[m, ">= 90%", "< 85%", f"{(i * 7 + j) % 100}%"] for j, m in enumerate(metrics)]),
+            Shape(int(0.6 * inch), int(1.5 * inch), int(0.06 * inch), int(0.8 * inch), BLUE, NO_COLOR),
+            TextBox(int(12.3 * inch), int(7.05 * inch), int(0.8 * inch), int(0.3 * inch),
+                    str(i), size=10, color=GRAY, align=RIGHT),
+        ]
+        slides.append(Slide(i, elements))
+        made += len(elements)
+    return slides
+
+
+def _measure(build):
+    tracemalloc.start()
+    obj = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return obj, size
+
+
+def _best(fn, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench(n_elements=20000):
+    slides = _sample_slides(n_elements)
+    count = sum(len(s.elements) for s in slides)
+    as_json = json.dumps([s.to_dict() for s in slides]).encode()
+    as_pickle_dicts = pickle.dumps([s.to_dict() for s in slides], pickle.HIGHEST_PROTOCOL)
+    as_pickle = pickle.dumps(slides, pickle.HIGHEST_PROTOCOL)
+    as_binary = dumps(slides)
+    assert loads(as_binary) == slides
+
+    _, dict_mem = _measure(lambda: json.loads(as_json))
+    _, spec_mem = _measure(lambda: loads(as_binary))
+
+    print(f"{count} elements on {len(slides)} slides")
+    print(f"  memory / element   dicts {dict_mem / count:7.0f} B    specs {spec_mem / count:7.0f} B")
+    rows = [
+        ("json -> dicts", as_json, lambda: json.loads(as_json)),
+        ("json -> specs", as_json, lambda: [Slide.from_dict(d) for d in json.loads(as_json)]),
+        ("pickle dicts", as_pickle_dicts, lambda: pickle.loads(as_pickle_dicts)),
+        ("pickle specs", as_pickle, lambda: pickle.loads(as_pickle)),
+        ("binary specs", as_binary, lambda: loads(as_binary)),
+    ]
+    for name, blob, fn in rows:
+        seconds = _best(fn)
+        print(f"  {name:14s} {len(blob) / 1024:9.0f} KiB   load {seconds * 1000:8.1f} ms"
+              f"   ({seconds / count * 1e6:.2f} us/element)")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--bench":
+        bench(int(sys.argv[2]) if len(sys.argv) > 2 else 20000)
+    else:
+        print(__doc__.strip())
@@ -0,0 +1,257 @@
+"""
+Watch mode -- live .pptx preview of the markdown docs
+Keeps python-pptx and the template warm and re-renders only what changed.
+
+Usage:
+    python watch_pptx.py watch [-o preview.pptx] [--poll]
+    python watch_pptx.py build [-o preview.pptx]           (one-shot)
+
+Sources are the .md files under architecture-slide-deck/, testing-architecture/
+and interview-testing-guide/ (see md_slides.py for the mapping). Changes are
+picked up with inotify on Linux, or by polling mtimes elsewhere / with --poll.
+Bursts of saves are debounced; each changed file has only its own slides
+replaced in the in-memory deck, then the deck is saved (atomically, so a
+viewer never opens a half-written file).
+"""
+
+import argparse
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+
+from pptx.opc.packuri import PackURI
+
+import generate_pptx as g
+import md_slides
+import slide_spec
+
+SOURCES = ("architecture-slide-deck", "testing-architecture", "interview-testing-guide")
+DEBOUNCE = 0.15                  # seconds of quiet that end a burst of saves
+POLL = 0.2
+
+
+def source_files(root):
+    files = []
+    for folder in SOURCES:
+        path = os.path.join(root, folder)
+        if os.path.isdir(path):
+            files += [os.path.join(path, f) for f in sorted(os.listdir(path)) if f.endswith(".md")]
+    return files
+
+
+# ══════════════════════════════════════════════════════════════
+# LIVE DECK -- one warm Presentation, slides owned per source file
+# ══════════════════════════════════════════════════════════════
+class LiveDeck:
+    def __init__(self, root, output):
+        self.root, self.output = root, output
+        self.prs = g.new_presentation()
+        self.owned = {}          # source path -> [slide part]
+        self.serial = 0          # last slide part number handed out
+
+    def refresh(self, paths):
+        """Re-render the slides of `paths` (changed, added or deleted files).
+
+        Every file is parsed before the deck is touched, so a parse error
+        leaves the deck as it was.
+        """
+        specs = {path: md_slides.parse_file(path) for path in paths if os.path.exists(path)}
+        for path in paths:
+            self._drop(path)
+            if path in specs:
+                self.owned[path] = [self._add(spec) for spec in specs[path]]
+        self._reorder()
+        tmp = self.output + ".tmp"
+        self.prs.save(tmp)
+        os.replace(tmp, self.output)
+
+    def _add(self, spec):
+        """Render one slide under a part name never used before in this deck.
+
+        python-pptx names a new slide after the current slide count, which
+        collides once slides have been dropped. A saved part is never renamed:
+        its relationship caches the target name the first time it's written.
+        """
+        part = slide_spec.render_slide(spec, self.prs).part
+        self.serial += 1
+        part.partname = PackURI(f"/ppt/slides/slide{self.serial}.xml")
+        return part
+
+    def _drop(self, path):
+        parts = set(self.owned.pop(path, ()))
+        if not parts:
+            return
+        pres = self.prs.part
+        sld_lst = pres._element.sldIdLst
+        for sld_id in list(sld_lst):
+            if pres.related_part(sld_id.rId) in parts:
+                sld_lst.remove(sld_id)
+                pres.drop_rel(sld_id.rId)
+
+    def _reorder(self):
+        """Put slides in source order (sldIdLst only; part names stay as they are)."""
+        pres = self.prs.part
+        sld_lst = pres._element.sldIdLst
+        by_part = {pres.related_part(s.rId): s for s in sld_lst}
+        order = [part for path in source_files(self.root) for part in self.owned.get(path, ())]
+        for sld_id in list(sld_lst):
+            sld_lst.remove(sld_id)
+        for part in order:
+            sld_lst.append(by_part[part])
+
+    def slide_count(self):
+        return sum(len(parts) for parts in self.owned.values())
+
+
+# ══════════════════════════════════════════════════════════════
+# WATCHERS -- wait(timeout) returns the set of changed paths
+# ══════════════════════════════════════════════════════════════
+class InotifyWatcher:
+    IN_MODIFY, IN_CLOSE_WRITE, IN_MOVED_FROM, IN_MOVED_TO = 0x2, 0x8, 0x40, 0x80
+    IN_CREATE, IN_DELETE = 0x100, 0x200
+    MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+    _EVENT = struct.Struct("iIII")
+
+    def __init__(self, dirs):
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify is Linux-only")
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.dirs = {}
+        for d in dirs:
+            wd = libc.inotify_add_watch(self.fd, os.fsencode(d), self.MASK)
+            if wd < 0:
+                raise OSError(ctypes.get_errno(), f"cannot watch {d}")
+            self.dirs[wd] = d
+
+    def wait(self, timeout=None):
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+        data, changed, offset = os.read(self.fd, 65536), set(), 0
+        while offset < len(data):
+            wd, _mask, _cookie, length = self._EVENT.unpack_from(data, offset)
+            offset += self._EVENT.size
+            name = data[offset:offset + length].rstrip(b"\0")
+            offset += length
+            if wd in self.dirs and name:
+                changed.add(os.path.join(self.dirs[wd], os.fsdecode(name)))
+        return changed
+
+    def close(self):
+        os.close(self.fd)
+
+
+class PollingWatcher:
+    def __init__(self, dirs, interval=POLL):
+        self.dirs, self.interval = dirs, interval
+        self.seen = self._scan()
+
+    def _scan(self):
+        state = {}
+        for d in self.dirs:
+            for entry in os.scandir(d):
+                if entry.is_file():
+                    st = entry.stat()
+                    state[entry.path] = (st.st_mtime_ns, st.st_size)
+        return state
+
+    def wait(self, timeout=None):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            now = self._scan()
+            changed = {p for p in now.keys() | self.seen.keys() if now.get(p) != self.seen.get(p)}
+            self.seen = now
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return changed
+            time.sleep(self.interval if deadline is None
+                       else max(0, min(self.interval, deadline - time.monotonic())))
+
+    def close(self):
+        pass
+
+
+def make_watcher(dirs, poll=False):
+    if not poll:
+        try:
+            return InotifyWatcher(dirs)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(dirs)
+
+
+def _refresh(deck, paths):
+    """deck.refresh(paths); a failure is reported, not raised -- a bad parse,
+    or the output held open by PowerPoint, must not end the session."""
+    try:
+        deck.refresh(paths)
+    except Exception as e:
+        names = ", ".join(os.path.basename(p) for p in paths) if len(paths) <= 3 else f"{len(paths)} files"
+        print(f"[ERROR] {names}: {type(e).__name__}: {e}")
+        return False
+    return True
+
+
+def watch(root, output, poll=False):
+    deck = LiveDeck(root, output)
+    started = time.perf_counter()
+    pending = set()                          # paths whose last refresh failed; retried with the next change
+    if _refresh(deck, source_files(root)):
+        print(f"[OK] {output}: {deck.slide_count()} slides "
+              f"({time.perf_counter() - started:.1f}s cold start)")
+    else:
+        pending = set(source_files(root))
+
+    dirs = [os.path.join(root, d) for d in SOURCES if os.path.isdir(os.path.join(root, d))]
+    watcher = make_watcher(dirs, poll)
+    print(f"     watching {len(dirs)} folder(s) with {type(watcher).__name__}, Ctrl+C to stop")
+    try:
+        while True:
+            changed = watcher.wait()
+            while True:                      # debounce: wait for the burst to settle
+                more = watcher.wait(DEBOUNCE)
+                if not more:
+                    break
+                changed |= more
+            changed = {p for p in changed if p.endswith(".md")}
+            if not changed:
+                continue
+            changed, pending = sorted(changed | pending), set()
+            started = time.perf_counter()
+            if not _refresh(deck, changed):
+                pending = set(changed)
+                continue
+            names = ", ".join(os.path.basename(p) for p in changed)
+            print(f"[OK] {names} -> {output} "
+                  f"({(time.perf_counter() - started) * 1000:.0f} ms, {deck.slide_count()} slides)")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Live .pptx preview of the markdown docs.")
+    parser.add_argument("command", choices=("watch", "build"))
+    parser.add_argument("-o", "--output", default="preview.pptx")
+    parser.add_argument("--root", default=os.path.dirname(os.path.abspath(__file__)))
+    parser.add_argument("--poll", action="store_true", help="poll mtimes instead of inotify")
+    args = parser.parse_args(argv)
+
+    if args.command == "watch":
+        watch(args.root, args.output, args.poll)
+    else:
+        deck = LiveDeck(args.root, args.output)
+        deck.refresh(source_files(args.root))
+        print(f"[OK] Saved: {args.output} ({deck.slide_count()} slides)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())